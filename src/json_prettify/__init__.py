@@ -5,10 +5,13 @@ __author__ = "Your Name"
 __email__ = "you@example.com"
 
 from .prettify import prettify_json
-from .formatter import format_json, format_json_stream
+from .formatter import format_json, format_json_bytes, format_json_stream
 from .validator import (
     validate_json,
+    validate_json_bytes,
     validate_json_file,
+    validate_json_files,
+    validate_json_stream,
     get_validation_errors,
     JSONValidationError,
     ValidationError
@@ -17,9 +20,13 @@ from .validator import (
 __all__ = [
     "prettify_json",
     "format_json",
+    "format_json_bytes",
     "format_json_stream",
     "validate_json",
+    "validate_json_bytes",
     "validate_json_file", 
+    "validate_json_files",
+    "validate_json_stream",
     "get_validation_errors",
     "JSONValidationError",
     "ValidationError"
@@ -3,29 +3,52 @@
 import json
 import sys
 from pathlib import Path
-from typing import Optional, List, Union, Tuple
+from typing import Any, Literal, Optional, List, Union, Tuple, cast
+from contextlib import ExitStack
+from functools import lru_cache, partial
 import os
+import codecs
+import mmap
 
 import click
 from rich.console import Console
-from rich.syntax import Syntax
 from rich.panel import Panel
-from rich.text import Text
-from rich import print as rprint
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TimeRemainingColumn
 
-from .formatter import format_json, format_json_stream
-from .validator import validate_json, validate_json_file, get_validation_errors
-from .schema_validator import validate_against_schema
-from .stats import calculate_json_stats, format_stats_output
+from .formatter import _stream_format_file, format_json, format_json_stream
+from .validator import (
+    SIMDJSON_MAX_SIZE,
+    STREAM_MIN_SIZE,
+    _simdjson_accepts,
+    get_validation_errors,
+    validate_json_file,
+    validate_json_stream,
+)
+
+# rich.syntax (pygments), rich.progress, jsonschema, ijson, the process pool
+# and the stats module are imported where they are used, so plain formatting
+# runs don't pay for them.
 
 __version__ = "1.0.0"
 
 console = Console()
 error_console = Console(stderr=True)
 
+# Chunk size for progress-reporting reads and writes of large files
+IO_CHUNK_SIZE = 1024 * 1024
+
+# Panel factories shared by every message of the same kind
+_ERROR_PANEL = partial(Panel, title="[red]Error[/red]", border_style="red")
+_SCHEMA_ERROR_PANEL = partial(Panel, title="[red]Schema Validation Error[/red]", border_style="red")
+_STATS_PANEL = partial(Panel, border_style="blue")
+
+# With --jobs 0 (auto), fewer files than this are processed serially
+PARALLEL_MIN_FILES = 8
 
-def get_indent_value(indent_str: str) -> Union[int, str, None]:
+# Worker processes capture console output, so they must not draw live progress
+_progress_enabled = True
+
+
+def get_indent_value(indent_str: str) -> Union[int, str]:
     """Convert indent string to appropriate value."""
     if indent_str == "tab":
         return "\t"
@@ -35,17 +58,57 @@ def get_indent_value(indent_str: str) -> Union[int, str, None]:
         raise click.BadParameter(f"Invalid indent value: {indent_str}. Must be 2, 4, or 'tab'")
 
 
+class BinaryInputError(ValueError):
+    """Raised when file content is binary data rather than JSON text."""
+
+
+def decode_content(data: Union[bytes, mmap.mmap], encoding: str) -> str:
+    """Decode raw file bytes, rejecting binary data before paying for the decode.
+    
+    NUL never occurs in JSON text in a byte-oriented encoding, so a memchr
+    scan of the raw buffer identifies binary files.  UTF-16 and UTF-32 text
+    legitimately contains NUL bytes and is checked after decoding instead.
+    ``data`` may also be a memory map of the file, which is decoded in place.
+    """
+    wide = codecs.lookup(encoding).name.startswith(("utf-16", "utf-32"))
+    if not wide and data.find(b"\x00") != -1:
+        raise BinaryInputError("Binary data detected - not a valid JSON text file")
+    
+    content = str(data, encoding)
+    if wide and "\x00" in content:
+        raise BinaryInputError("Binary data detected - not a valid JSON text file")
+    return content
+
+
+def read_stdin(encoding: str) -> str:
+    """Read all of stdin as raw bytes and decode it with ``encoding``.
+    
+    Like files, stdin is decoded in one C-level call and honours
+    --encoding instead of the locale's default text encoding.
+    """
+    stream = getattr(sys.stdin, "buffer", None)
+    if stream is None:
+        # Replaced by a text-only stream (e.g. io.StringIO)
+        return sys.stdin.read()
+    return decode_content(stream.read(), encoding)
+
+
 def read_file_with_progress(file_path: Path, encoding: str, no_color: bool) -> Optional[str]:
     """Read a file with progress bar for large files (>1MB)."""
     file_size = file_path.stat().st_size
     
     # Only show progress for files larger than 1MB
-    if file_size <= 1024 * 1024 or no_color:
-        # Read normally for small files or when no-color is set
-        with open(file_path, "r", encoding=encoding) as f:
-            return f.read()
+    if file_size <= 1024 * 1024:
+        with open(file_path, "rb") as f:
+            return decode_content(f.read(), encoding)
+    if no_color or not _progress_enabled:
+        # Decode straight from the page cache, without a full-size bytes copy
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return decode_content(mm, encoding)
     
     # Show progress for large files
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TimeRemainingColumn
+    
     content_parts = []
     
     with Progress(
@@ -62,15 +125,16 @@ def read_file_with_progress(file_path: Path, encoding: str, no_color: bool) -> O
             total=file_size
         )
         
-        with open(file_path, "r", encoding=encoding) as f:
+        with open(file_path, "rb") as f:
             while True:
-                chunk = f.read(8192)  # Read in 8KB chunks
+                chunk = f.read(IO_CHUNK_SIZE)
                 if not chunk:
                     break
                 content_parts.append(chunk)
-                progress.update(task, advance=len(chunk.encode(encoding)))
+                progress.update(task, advance=len(chunk))
     
-    return ''.join(content_parts)
+    # Decode once so multi-byte characters split across chunks are handled
+    return decode_content(b''.join(content_parts), encoding)
 
 
 def write_file_with_progress(file_path: Path, content: str, encoding: str, no_color: bool) -> None:
@@ -79,13 +143,15 @@ def write_file_with_progress(file_path: Path, content: str, encoding: str, no_co
     content_size = len(content_bytes)
     
     # Only show progress for content larger than 1MB
-    if content_size <= 1024 * 1024 or no_color:
+    if content_size <= 1024 * 1024 or no_color or not _progress_enabled:
         # Write normally for small content or when no-color is set
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        with open(file_path, "wb") as f:
+            f.write(content_bytes)
         return
     
     # Show progress for large content
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TimeRemainingColumn
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[bold green]Writing {task.description}"),
@@ -100,13 +166,101 @@ def write_file_with_progress(file_path: Path, content: str, encoding: str, no_co
             total=content_size
         )
         
-        with open(file_path, "w", encoding=encoding) as f:
-            # Write in chunks
-            chunk_size = 8192
-            for i in range(0, len(content), chunk_size):
-                chunk = content[i:i + chunk_size]
+        with open(file_path, "wb") as f:
+            # Write the already encoded bytes in chunks; memoryview slices
+            # hand each chunk to the file without copying it first
+            view = memoryview(content_bytes)
+            for i in range(0, content_size, IO_CHUNK_SIZE):
+                chunk = view[i:i + IO_CHUNK_SIZE]
                 f.write(chunk)
-                progress.update(task, advance=len(chunk.encode(encoding)))
+                progress.update(task, advance=len(chunk))
+
+
+def stream_validate_file(file_path: Path, encoding: str) -> bool:
+    """
+    Check that a large UTF-8 file is valid JSON without building its tree.
+    
+    Files up to SIMDJSON_MAX_SIZE are first checked from a memory map by
+    simdjson; anything it does not accept, and larger files, are streamed
+    through ijson, which needs memory proportional to nesting depth only.
+    validate_json_stream rejects the vertical tabs and form feeds yajl
+    would skip as whitespace, so the stream verdict is a strict one.
+    Returns True only when the document parses; in every other case (ijson
+    missing, small file, other encodings, invalid JSON) the caller falls
+    back to the regular path, which produces the detailed error messages.
+    """
+    try:
+        if codecs.lookup(encoding).name != "utf-8":
+            return False
+        file_size = file_path.stat().st_size
+        if file_size <= STREAM_MIN_SIZE:
+            return False
+        if file_size <= SIMDJSON_MAX_SIZE:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _simdjson_accepts(mm):
+                    return True
+        # Without ijson validate_json_stream would read the file whole
+        import ijson
+    except (ImportError, LookupError, OSError):
+        return False
+    try:
+        with open(file_path, "rb") as f:
+            return validate_json_stream(f, IO_CHUNK_SIZE) is True
+    except OSError:
+        return False
+
+
+def stream_format_file(
+    file_path: Path,
+    output_file: Path,
+    indent: Union[int, str],
+    sort_keys: bool,
+    compact: bool,
+    encoding: str,
+    ensure_ascii: bool = False,
+) -> bool:
+    """
+    Format a large UTF-8 file straight into ``output_file`` through ijson.
+    
+    The document is never held in memory as text or as a parsed tree.
+    Returns True once ``output_file`` holds the formatted document; in every
+    other case (ijson missing, small file, other encodings, options the
+    streaming formatter cannot produce, invalid JSON or UTF-8, an object
+    repeating a key) nothing is written and the caller falls back to the
+    regular path, which reports any errors.
+    """
+    try:
+        if codecs.lookup(encoding).name != "utf-8":
+            return False
+        return _stream_format_file(
+            str(file_path), str(output_file), IO_CHUNK_SIZE,
+            {"indent": indent, "sort_keys": sort_keys, "compact": compact, "ensure_ascii": ensure_ascii},
+        )
+    except (LookupError, OSError):
+        return False
+
+
+@lru_cache(maxsize=None)
+def get_json_highlighting() -> Tuple[Any, Any]:
+    """Build the pygments JSON lexer and monokai theme once per process.
+    
+    Syntax looks a lexer name up again every time it renders and creates a
+    new theme per instance, which adds up over many files.
+    """
+    from pygments.lexers import get_lexer_by_name
+    from rich.syntax import Syntax
+    
+    lexer = get_lexer_by_name("json", stripnl=False, ensurenl=True, tabsize=4)
+    return lexer, Syntax.get_theme("monokai")
+
+
+def print_highlighted(result: str) -> None:
+    """Print formatted JSON to the console with syntax highlighting."""
+    from rich.syntax import Syntax
+    
+    lexer, theme = get_json_highlighting()
+    syntax = Syntax(result, lexer, theme=theme, line_numbers=False)
+    console.print(syntax)
 
 
 def process_single_file(
@@ -121,9 +275,20 @@ def process_single_file(
     encoding: str,
     schema: Optional[Path],
     stats: bool,
+    ensure_ascii: bool = False,
+    normalize: Optional[str] = None,
 ) -> Tuple[int, Optional[str]]:
     """Process a single file or stdin content."""
     try:
+        # Large files that only need validating are streamed instead of read
+        if file_path and validate_only and not schema and stream_validate_file(file_path, encoding):
+            success_msg = f"✓ Valid JSON ({file_path.name})"
+            if no_color:
+                console.print(f"OK: {success_msg}")
+            else:
+                console.print(f"[green]{success_msg}[/green]")
+            return 0, None
+        
         # Read content if file path provided
         if file_path:
             try:
@@ -133,21 +298,28 @@ def process_single_file(
                 if no_color:
                     error_console.print(f"Error: {error_msg}")
                 else:
-                    error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                    error_console.print(_ERROR_PANEL(error_msg))
                 return 1, None
             except PermissionError:
                 error_msg = f"Permission denied: '{file_path}'"
                 if no_color:
                     error_console.print(f"Error: {error_msg}")
                 else:
-                    error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                    error_console.print(_ERROR_PANEL(error_msg))
+                return 1, None
+            except BinaryInputError as e:
+                error_msg = str(e)
+                if no_color:
+                    error_console.print(f"Error: {error_msg}")
+                else:
+                    error_console.print(_ERROR_PANEL(error_msg))
                 return 1, None
             except UnicodeDecodeError as e:
                 error_msg = f"Encoding error in '{file_path}': {str(e)}"
                 if no_color:
                     error_console.print(f"Error: {error_msg}")
                 else:
-                    error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                    error_console.print(_ERROR_PANEL(error_msg))
                 return 1, None
         
         # Check for empty content
@@ -156,22 +328,30 @@ def process_single_file(
             if no_color:
                 error_console.print(f"Error: {error_msg}")
             else:
-                error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                error_console.print(_ERROR_PANEL(error_msg))
             return 1, None
         
-        # Check if content appears to be binary
-        if '\x00' in content:
+        # Check if stdin content appears to be binary (files are checked on read)
+        if file_path is None and '\x00' in content:
             error_msg = "Binary data detected - not a valid JSON text file"
             if no_color:
                 error_console.print(f"Error: {error_msg}")
             else:
-                error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                error_console.print(_ERROR_PANEL(error_msg))
             return 1, None
         
+        # Normalize once, so every later step sees the same code points
+        if normalize:
+            import unicodedata
+            
+            form = cast(Literal["NFC", "NFD", "NFKC", "NFKD"], normalize.upper())
+            content = unicodedata.normalize(form, content)
+        
         # Validation mode
         if validate_only and not schema:
-            validation_result = validate_json(content)
-            if validation_result is True:
+            # One parse yields either success or the detailed errors
+            errors = get_validation_errors(content)
+            if not errors:
                 success_msg = f"✓ Valid JSON{f' ({file_path.name})' if file_path else ''}"
                 if no_color:
                     console.print(f"OK: {success_msg}")
@@ -179,26 +359,23 @@ def process_single_file(
                     console.print(f"[green]{success_msg}[/green]")
                 return 0, None
             else:
-                # Get detailed errors
-                errors = get_validation_errors(content)
-                if errors:
-                    error = errors[0]
-                    error_msg = f"Invalid JSON{f' in {file_path.name}' if file_path else ''}: {error.message}"
-                    if error.line:
-                        error_msg += f" at line {error.line}"
-                    if error.column:
-                        error_msg += f", column {error.column}"
-                else:
-                    error_msg = f"Invalid JSON{f' in {file_path.name}' if file_path else ''}: {validation_result}"
+                error = errors[0]
+                error_msg = f"Invalid JSON{f' in {file_path.name}' if file_path else ''}: {error.message}"
+                if error.line:
+                    error_msg += f" at line {error.line}"
+                if error.column:
+                    error_msg += f", column {error.column}"
                 
                 if no_color:
                     error_console.print(f"Error: {error_msg}")
                 else:
-                    error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                    error_console.print(_ERROR_PANEL(error_msg))
                 return 1, None
         
         # Schema validation if requested
         if schema:
+            from .schema_validator import validate_against_schema
+            
             schema_errors = validate_against_schema(content, schema, encoding)
             if schema_errors:
                 error_msg = f"Schema validation failed{f' for {file_path.name}' if file_path else ''}:"
@@ -208,7 +385,7 @@ def process_single_file(
                         error_console.print(f"  - {err}")
                 else:
                     error_lines = [error_msg] + [f"• {err}" for err in schema_errors]
-                    error_console.print(Panel("\n".join(error_lines), title="[red]Schema Validation Error[/red]", border_style="red"))
+                    error_console.print(_SCHEMA_ERROR_PANEL("\n".join(error_lines)))
                 return 1, None
             elif validate_only:
                 success_msg = f"✓ Valid JSON matching schema{f' ({file_path.name})' if file_path else ''}"
@@ -220,6 +397,8 @@ def process_single_file(
         
         # Show statistics if requested
         if stats:
+            from .stats import calculate_json_stats, format_stats_output
+            
             try:
                 json_stats = calculate_json_stats(content)
                 stats_output = format_stats_output(json_stats, no_color)
@@ -227,7 +406,7 @@ def process_single_file(
                 if no_color:
                     console.print(stats_output)
                 else:
-                    console.print(Panel(stats_output, title=f"[blue]JSON Statistics{f' - {file_path.name}' if file_path else ''}[/blue]", border_style="blue"))
+                    console.print(_STATS_PANEL(stats_output, title=f"[blue]JSON Statistics{f' - {file_path.name}' if file_path else ''}[/blue]"))
                 
                 # If only showing stats, don't format
                 if not output_file:
@@ -237,43 +416,19 @@ def process_single_file(
                 if no_color:
                     error_console.print(f"Error: {error_msg}")
                 else:
-                    error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                    error_console.print(_ERROR_PANEL(error_msg))
                 # Continue with formatting even if stats fail
         
         # Format JSON
-        # Convert tab indent for formatter
-        format_indent = None if compact else indent
-        if isinstance(format_indent, str) and format_indent == "\t":
-            # json module doesn't support tab directly, we'll post-process
-            format_indent = 2
-            use_tabs = True
-        else:
-            use_tabs = False
-        
         try:
             result = format_json(
                 content,
-                indent=format_indent,
+                indent=None if compact else indent,
                 sort_keys=sort_keys,
                 compact=compact,
-                ensure_ascii=False
+                ensure_ascii=ensure_ascii
             )
             
-            # Post-process for tab indentation
-            if use_tabs and not compact:
-                lines = result.split('\n')
-                processed_lines = []
-                for line in lines:
-                    # Count leading spaces and convert to tabs
-                    stripped = line.lstrip(' ')
-                    space_count = len(line) - len(stripped)
-                    if space_count > 0:
-                        tab_count = space_count // 2  # Since we used indent=2
-                        processed_lines.append('\t' * tab_count + stripped)
-                    else:
-                        processed_lines.append(line)
-                result = '\n'.join(processed_lines)
-            
         except json.JSONDecodeError as e:
             # Get detailed error information
             errors = get_validation_errors(content)
@@ -292,14 +447,14 @@ def process_single_file(
             if no_color:
                 error_console.print(f"Error: {error_msg}")
             else:
-                error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                error_console.print(_ERROR_PANEL(error_msg))
             return 1, None
         except ValueError as e:
             error_msg = str(e)
             if no_color:
                 error_console.print(f"Error: {error_msg}")
             else:
-                error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                error_console.print(_ERROR_PANEL(error_msg))
             return 1, None
         
         return 0, result
@@ -309,10 +464,33 @@ def process_single_file(
         if no_color:
             error_console.print(f"Error: {error_msg}")
         else:
-            error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+            error_console.print(_ERROR_PANEL(error_msg))
         return 1, None
 
 
+def get_worker_count(jobs: int, file_count: int) -> int:
+    """Resolve the --jobs option to a number of worker processes."""
+    if jobs == 0:
+        if file_count < PARALLEL_MIN_FILES:
+            return 1
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, file_count))
+
+
+def process_file_captured(file_path: Path, *args: Any) -> Tuple[int, Optional[str], str, str]:
+    """Run process_single_file in a worker process, capturing its console output.
+    
+    Returns the exit code and result together with the captured stdout and
+    stderr text, which the parent replays in input order.
+    """
+    global _progress_enabled
+    _progress_enabled = False
+    
+    with console.capture() as out, error_console.capture() as err:
+        code, result = process_single_file(file_path, None, *args)
+    return code, result, out.get(), err.get()
+
+
 @click.command()
 @click.argument("files", nargs=-1, type=click.Path(path_type=Path))
 @click.option(
@@ -367,6 +545,23 @@ def process_single_file(
     is_flag=True,
     help="Show JSON statistics (keys, depth, size, etc.)",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Worker processes for multiple files (0 = auto, 1 = serial) (default: 0)",
+)
+@click.option(
+    "--ensure-ascii",
+    is_flag=True,
+    help="Escape non-ASCII characters as \\uXXXX sequences",
+)
+@click.option(
+    "--normalize",
+    type=click.Choice(["NFC", "NFD", "NFKC", "NFKD"], case_sensitive=False),
+    help="Apply Unicode normalization to the input (changes the output bytes)",
+)
 @click.version_option(version=__version__, prog_name="json-prettify")
 def main(
     files: Tuple[Path, ...],
@@ -379,6 +574,9 @@ def main(
     encoding: str,
     schema: Optional[Path],
     stats: bool,
+    jobs: int,
+    ensure_ascii: bool,
+    normalize: Optional[str],
 ) -> None:
     """Pretty-print JSON with syntax highlighting.
 
@@ -389,6 +587,7 @@ def main(
     - Schema validation with --schema flag
     - JSON statistics with --stats flag
     - Write to file with --output flag
+    - Parallel processing of multiple files with --jobs flag
     """
     # Parse indent option
     try:
@@ -404,10 +603,22 @@ def main(
     # Process stdin if no files provided or "-" is specified
     if not files or (len(files) == 1 and str(files[0]) == "-"):
         # Check if stdin is provided (handle "-" as well)
-        content = sys.stdin.read()
+        try:
+            content = read_stdin(encoding)
+        except (BinaryInputError, UnicodeDecodeError) as e:
+            if isinstance(e, BinaryInputError):
+                error_msg = str(e)
+            else:
+                error_msg = f"Encoding error in stdin: {str(e)}"
+            if no_color:
+                error_console.print(f"Error: {error_msg}")
+            else:
+                error_console.print(_ERROR_PANEL(error_msg))
+            sys.exit(1)
         code, result = process_single_file(
             None, content, indent_value, sort_keys, compact,
-            validate_only, no_color, output, encoding, schema, stats
+            validate_only, no_color, output, encoding, schema, stats, ensure_ascii,
+            normalize
         )
         exit_code = max(exit_code, code)
         
@@ -419,49 +630,88 @@ def main(
                 if no_color or compact:
                     click.echo(result)
                 else:
-                    syntax = Syntax(result, "json", theme="monokai", line_numbers=False)
-                    console.print(syntax)
+                    print_highlighted(result)
+    elif (
+        len(files) == 1 and output and not (validate_only or schema or stats or normalize)
+        and stream_format_file(
+            files[0], output, indent_value, sort_keys, compact, encoding, ensure_ascii
+        )
+    ):
+        # A large file written to --output was formatted as a stream
+        if not no_color:
+            console.print(f"[green]✓ Written to {output}[/green]")
     else:
-        # Process multiple files
-        for i, file_path in enumerate(files):
-            # Check if file exists
-            if not file_path.exists():
-                error_msg = f"File '{file_path}' not found"
-                if no_color:
-                    error_console.print(f"Error: {error_msg}")
-                else:
-                    error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
-                exit_code = 1
-                continue
-            
-            # Show file separator for multiple files
-            if len(files) > 1 and not validate_only and not output:
-                if i > 0:
-                    console.print()  # Empty line between files
-                if no_color:
-                    console.print(f"--- {file_path.name} ---")
-                else:
-                    console.print(f"[blue]--- {file_path.name} ---[/blue]")
-            
-            code, result = process_single_file(
-                file_path, None, indent_value, sort_keys, compact,
-                validate_only, no_color, output, encoding, schema, stats
-            )
-            exit_code = max(exit_code, code)
+        # Process multiple files, in worker processes when worthwhile.
+        # Results come back in input order, also for a combined --output.
+        workers = get_worker_count(jobs, len(files))
+        futures = {}
+        with ExitStack() as stack:
+            if workers > 1:
+                from concurrent.futures import ProcessPoolExecutor
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                for i, file_path in enumerate(files):
+                    if file_path.exists():
+                        futures[i] = executor.submit(
+                            process_file_captured, file_path, indent_value, sort_keys,
+                            compact, validate_only, no_color, output, encoding, schema,
+                            stats, ensure_ascii, normalize
+                        )
             
-            if code == 0 and result and not validate_only:
-                if output:
-                    all_outputs.append(result)
-                    # Add separator between files in output
-                    if i < len(files) - 1:
-                        all_outputs.append("")
+            for i, file_path in enumerate(files):
+                # Check if file exists
+                if not file_path.exists():
+                    error_msg = f"File '{file_path}' not found"
+                    if no_color:
+                        error_console.print(f"Error: {error_msg}")
+                    else:
+                        error_console.print(_ERROR_PANEL(error_msg))
+                    exit_code = 1
+                    continue
+                
+                # Show file separator for multiple files
+                if len(files) > 1 and not validate_only and not output:
+                    if i > 0:
+                        console.print()  # Empty line between files
+                    if no_color:
+                        console.print(f"--- {file_path.name} ---")
+                    else:
+                        console.print(f"[blue]--- {file_path.name} ---[/blue]")
+                
+                if i in futures:
+                    try:
+                        code, result, out, err = futures[i].result()
+                    except Exception as e:
+                        # The worker crashed or its arguments or result could
+                        # not be pickled; reported like any failed file
+                        error_msg = str(e)
+                        if no_color:
+                            error_console.print(f"Error: {error_msg}")
+                        else:
+                            error_console.print(_ERROR_PANEL(error_msg))
+                        code, result = 1, None
+                    else:
+                        console.file.write(out)
+                        error_console.file.write(err)
                 else:
-                    # Output with or without syntax highlighting
-                    if no_color or compact:
-                        click.echo(result)
+                    code, result = process_single_file(
+                        file_path, None, indent_value, sort_keys, compact,
+                        validate_only, no_color, output, encoding, schema, stats,
+                        ensure_ascii, normalize
+                    )
+                exit_code = max(exit_code, code)
+                
+                if code == 0 and result and not validate_only:
+                    if output:
+                        all_outputs.append(result)
+                        # Add separator between files in output
+                        if i < len(files) - 1:
+                            all_outputs.append("")
                     else:
-                        syntax = Syntax(result, "json", theme="monokai", line_numbers=False)
-                        console.print(syntax)
+                        # Output with or without syntax highlighting
+                        if no_color or compact:
+                            click.echo(result)
+                        else:
+                            print_highlighted(result)
     
     # Write to output file if specified
     if output and all_outputs:
@@ -480,7 +730,7 @@ def main(
             if no_color:
                 error_console.print(f"Error: {error_msg}")
             else:
-                error_console.print(Panel(error_msg, title="[red]Error[/red]", border_style="red"))
+                error_console.print(_ERROR_PANEL(error_msg))
             sys.exit(1)
     
     sys.exit(exit_code)
@@ -1,14 +1,248 @@
 """JSON formatter with support for various formatting options and streaming."""
 
 import json
-from typing import Any, Dict, Optional, Tuple, Union, IO
+import shutil
+from decimal import Decimal
+from functools import lru_cache
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import Any, Dict, Optional, Set, Tuple, Union, IO, List, cast
 import io
+import mmap
 import os
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import rapidjson
+except ImportError:  # pragma: no cover - optional speedup
+    rapidjson = None  # type: ignore[assignment]
+
+# Files from this size up are re-indented from a stream of parser events
+# with memory bounded by nesting depth; smaller ones are faster to format
+# in memory with the C backends
+STREAM_MIN_SIZE = 32 * 1024 * 1024
+
+# Buffer size of the streamed output file, so each flush writes 64 KiB
+STREAM_BUFFER_SIZE = 64 * 1024
+
+# Keyword arguments of format_json the streaming formatter can honour
+_STREAMABLE_OPTIONS = frozenset(('indent', 'sort_keys', 'compact', 'ensure_ascii', 'separators'))
+
+# JSON texts whose formatted output is the text itself, whatever the options
+_SELF_FORMATTING_LITERALS = frozenset(('{}', '[]', 'null', 'true', 'false'))
+
+# A control character escape with upper-case hex digits, as rapidjson writes
+# them; the even run of backslashes before it keeps an escaped backslash
+# followed by the text "u001F" from matching
+_UPPER_CONTROL_ESCAPE_RE = re.compile(r'(?<!\\)((?:\\\\)*)\\u00([01][A-F])')
+
+# Maps every digit to '0' and 'E' to 'e' (deleting '+'), so the shape of a
+# number literal orjson writes differently becomes a plain substring
+_NUMBER_SHAPE = bytes.maketrans(b'123456789E', b'000000000e')
+
+
+def _fast_loads(data: Union[str, bytes], exact: bool = True) -> Any:
+    """
+    Parse JSON text with the fastest installed backend.
+    
+    rapidjson keeps integers exact.  With ``exact=False`` orjson is tried
+    first: it is faster still but reads integers beyond 64 bits as floats,
+    which only matters when the values are kept rather than inspected for
+    validity, structure or types.  Anything an accelerated parser rejects,
+    nesting beyond rapidjson's depth limit included, is re-parsed by the
+    stdlib, which keeps error messages, positions and the stdlib's wider
+    acceptance (e.g. ``1e999``) identical to ``json.loads``.  rapidjson
+    stops reading at a NUL character and ignores the rest, so text holding
+    one, which is never valid JSON, is left to the other parsers.
+    """
+    if not exact and orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    has_nul = b'\x00' in data if isinstance(data, bytes) else '\x00' in data
+    if rapidjson is not None and not has_nul:
+        try:
+            return rapidjson.loads(data)
+        except (ValueError, RecursionError):
+            pass
+    return json.loads(data)
+
+
+def _fast_dumps(
+    obj: Any,
+    indent: Optional[Union[int, str]] = None,
+    sort_keys: bool = False,
+    ensure_ascii: bool = True,
+    separators: Optional[Tuple[str, str]] = None,
+    source: Optional[str] = None
+) -> str:
+    """
+    Serialize ``obj`` like ``json.dumps`` using the fastest suitable backend.
+    
+    Args:
+        obj: Value to serialize
+        indent: Indentation as for ``json.dumps``
+        sort_keys: Whether to sort object keys alphabetically
+        ensure_ascii: If False, preserves Unicode characters
+        separators: Custom separators tuple (item_sep, key_sep)
+        source: JSON text ``obj`` was parsed from, if it came straight from
+            a JSON parser and so only holds plain JSON types
+            
+    Returns:
+        Serialized JSON string
+    """
+    # Minified output, which both accelerated backends write by default
+    compact = (
+        indent is None and separators is not None and tuple(separators) == (',', ':')
+    )
+    
+    if not ensure_ascii and (separators is None or compact):
+        # orjson serializes an order of magnitude faster than the stdlib, but
+        # only knows 2-space indentation, always emits UTF-8 and accepts types
+        # (datetime, dataclasses, ...) the stdlib rejects.
+        if (
+            orjson is not None
+            and (indent == 2 or compact)
+            and source is not None
+            and _is_orjson_text(source)
+        ):
+            option = orjson.OPT_INDENT_2 if indent == 2 else 0
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(obj, option=option).decode('utf-8')
+            except TypeError:
+                # Integers beyond 64 bits or lone surrogates
+                pass
+        
+        # rapidjson handles any indent width and tabs with output identical to
+        # the stdlib once control character escapes are lower-cased, but
+        # escapes differently when ensure_ascii is set.  By default it also
+        # writes bytes as strings and any iterable as an array, which the
+        # stdlib rejects; tuples are left to the stdlib along with those.
+        if rapidjson is not None and (compact or (indent is not None and indent != '')):
+            try:
+                text = rapidjson.dumps(
+                    obj, indent=indent, sort_keys=sort_keys, ensure_ascii=False,
+                    bytes_mode=rapidjson.BM_NONE,
+                    iterable_mode=rapidjson.IM_ONLY_LISTS
+                )
+            except (TypeError, ValueError, OverflowError, RecursionError):
+                # Non-string keys, unsupported types or circular references
+                pass
+            else:
+                if '\\u00' in text:
+                    text = _UPPER_CONTROL_ESCAPE_RE.sub(_lower_escape, text)
+                return text
+        
+        # Otherwise orjson's 2-space output can be re-indented, still well
+        # ahead of the stdlib's Python-level pretty printer
+        if (
+            orjson is not None
+            and (indent == '\t' or (type(indent) is int and indent >= 0))
+            and source is not None
+            and _is_orjson_text(source)
+        ):
+            option = orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                text = orjson.dumps(obj, option=option).decode('utf-8')
+            except TypeError:
+                pass
+            else:
+                unit = indent if isinstance(indent, str) else ' ' * indent
+                return _reindent(text, unit)
+    
+    return _get_encoder(
+        indent,
+        sort_keys,
+        ensure_ascii,
+        tuple(separators) if separators is not None else None
+    ).encode(obj)
+
+
+def _lower_escape(match: "re.Match[str]") -> str:
+    """Lower-case the hex digits of an ``_UPPER_CONTROL_ESCAPE_RE`` match."""
+    return match.group(1) + '\\u00' + match.group(2).lower()
+
+
+def _is_orjson_text(text: Union[str, bytes]) -> bool:
+    """
+    Return True if orjson writes the data parsed from ``text`` like json.dumps.
+    
+    orjson silently writes non-finite floats as ``null`` and writes floats
+    below 1e-4 or from 1e16 up in its own notation (``1.5e-7`` and
+    ``0.000011`` where the stdlib has ``1.5e-07`` and ``1.1e-05``), so only
+    data parsed from text without such numbers is passed to it.  Besides
+    the ``NaN`` and ``Infinity`` literals, these need an exponent, a
+    fraction starting with four zeros or 17 integer digits before the
+    point; integers parse to ``int`` and are never affected.  Lookalikes
+    inside strings only cost the fast path.
+    """
+    if isinstance(text, str):
+        if 'NaN' in text or 'Infinity' in text:
+            return False
+        text = text.encode('utf-8', 'surrogatepass')
+    elif b'NaN' in text or b'Infinity' in text:
+        return False
+    if b'0.0000' in text:
+        return False
+    shape = text.translate(_NUMBER_SHAPE, b'+')
+    return b'0e' not in shape and b'0' * 17 + b'.' not in shape
+
+
+def _reindent(text: str, unit: str) -> str:
+    """
+    Convert 2-space indented JSON text to indent with ``unit`` per level.
+    
+    JSON strings never span lines, so every run of spaces after a newline is
+    indentation.  Each pass converts one more nesting level with a C-level
+    ``str.replace``; converted lines are followed by a non-space character
+    and so never match the pattern of a deeper level.
+    """
+    if unit == '  ':
+        return text
+    
+    depth = 1
+    while True:
+        old = '\n' + unit * (depth - 1) + '  '
+        if old not in text:
+            return text
+        text = text.replace(old, '\n' + unit * depth)
+        depth += 1
+
+
+@lru_cache(maxsize=32)
+def _get_encoder(
+    indent: Optional[Union[int, str]],
+    sort_keys: bool,
+    ensure_ascii: bool,
+    separators: Optional[Tuple[str, str]]
+) -> json.JSONEncoder:
+    """
+    Return a shared stdlib encoder for one combination of options.
+    
+    ``json.dumps`` builds a new ``JSONEncoder`` on every call with
+    non-default options; encoders keep no state between ``encode`` calls,
+    so one per option set can be reused.
+    """
+    return json.JSONEncoder(
+        indent=indent,
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii,
+        separators=separators
+    )
 
 
 def format_json(
     data: Union[str, Dict[str, Any]], 
-    indent: Optional[int] = 2,
+    indent: Optional[Union[int, str]] = 2,
     sort_keys: bool = False,
     compact: bool = False,
     ensure_ascii: bool = True,
@@ -19,7 +253,7 @@ def format_json(
     
     Args:
         data: JSON string or dictionary to format
-        indent: Number of spaces for indentation (None for compact)
+        indent: Number of spaces or indent string such as '\t' (None for compact)
         sort_keys: Whether to sort object keys alphabetically
         compact: If True, produces minimal output without whitespace
         ensure_ascii: If False, preserves Unicode characters
@@ -40,6 +274,13 @@ def format_json(
     
     # Parse if string input
     if isinstance(data, str):
+        # Empty containers and null/true/false format to themselves under
+        # every option, so short inputs can skip the parse entirely
+        if len(data) < 32:
+            literal = data.strip()
+            if literal in _SELF_FORMATTING_LITERALS:
+                return literal
+        
         if not data.strip():
             raise json.JSONDecodeError("Expecting value", data, 0)
         
@@ -57,37 +298,301 @@ def format_json(
             raise ValueError("JSON does not support Infinity or NaN")
         
         try:
-            parsed_data = json.loads(data)
+            parsed_data = _fast_loads(data)
         except json.JSONDecodeError as e:
             raise e
+        
+        # ASCII text without \u escapes or DEL (which ensure_ascii escapes
+        # as \u007f) only holds strings ensure_ascii leaves alone; dropping
+        # it opens the fast backends
+        if ensure_ascii and data.isascii() and '\\u' not in data and '\x7f' not in data:
+            ensure_ascii = False
     else:
         parsed_data = data
     
     # Special handling for primitives and empty structures
     if isinstance(parsed_data, (type(None), bool, int, float, str)):
         # Primitives don't need formatting
-        return json.dumps(parsed_data, ensure_ascii=ensure_ascii)
+        return _get_encoder(None, False, ensure_ascii, None).encode(parsed_data)
     elif parsed_data == {} or parsed_data == []:
         # Empty structures
         return '{}' if parsed_data == {} else '[]'
     
     # Format with options
-    formatted = json.dumps(
+    return _fast_dumps(
         parsed_data,
         indent=indent,
         sort_keys=sort_keys,
         ensure_ascii=ensure_ascii,
-        separators=separators
+        separators=separators,
+        source=data if isinstance(data, str) else None
     )
+
+
+def format_json_bytes(
+    data: bytes,
+    indent: Optional[Union[int, str]] = 2,
+    sort_keys: bool = False,
+    compact: bool = False,
+    ensure_ascii: bool = True,
+    separators: Optional[Tuple[str, str]] = None
+) -> bytes:
+    """
+    Format UTF-8 encoded JSON and return UTF-8 encoded output.
+    
+    Equivalent to ``format_json(data.decode('utf-8'), ...).encode('utf-8')``,
+    but when rapidjson and orjson are both installed and orjson can produce
+    the requested layout, the document goes from bytes to bytes without a
+    decoded copy of the input or a ``str`` copy of the output.
+    
+    Args:
+        data: UTF-8 encoded JSON document
+        indent: Number of spaces or indent string such as '\t' (None for compact)
+        sort_keys: Whether to sort object keys alphabetically
+        compact: If True, produces minimal output without whitespace
+        ensure_ascii: If False, preserves Unicode characters
+        separators: Custom separators tuple (item_sep, key_sep)
+        
+    Returns:
+        Formatted JSON as UTF-8 bytes
+        
+    Raises:
+        ValueError: If the input is not valid JSON
+        json.JSONDecodeError: If the JSON string is malformed
+        UnicodeDecodeError: If the input is not valid UTF-8
+    """
+    if (
+        orjson is not None
+        and rapidjson is not None
+        and indent == 2
+        and not compact
+        and (
+            not ensure_ascii
+            or (data.isascii() and b'\\u' not in data and b'\x7f' not in data)
+        )
+        and separators is None
+        and b'\x00' not in data
+        and _is_orjson_text(data)
+    ):
+        try:
+            # rapidjson reads UTF-8 bytes directly and keeps integers exact,
+            # but would stop at a NUL byte and ignore what follows it
+            parsed_data = rapidjson.loads(data)
+        except ValueError:
+            # Let format_json produce the canonical error
+            parsed_data = None
+        
+        if isinstance(parsed_data, (dict, list)) and parsed_data:
+            option = orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(parsed_data, option=option)
+            except TypeError:
+                # Integers beyond 64 bits or lone surrogates
+                pass
+    
+    return format_json(
+        data.decode('utf-8'),
+        indent=indent,
+        sort_keys=sort_keys,
+        compact=compact,
+        ensure_ascii=ensure_ascii,
+        separators=separators
+    ).encode('utf-8')
+
+
+def _float_repr(value: float) -> str:
+    """Format a float the way ``json.dumps`` does."""
+    if value != value:
+        return 'NaN'
+    if value == float('inf'):
+        return 'Infinity'
+    if value == float('-inf'):
+        return '-Infinity'
+    return float.__repr__(value)
+
+
+def _stream_format(
+    events: Any,
+    write: Any,
+    indent: Union[int, str],
+    ensure_ascii: bool,
+    batch_size: int = 4096
+) -> bool:
+    """
+    Write indented JSON for a sequence of ijson ``basic_parse`` events.
+    
+    Produces the same text as ``json.dumps(..., indent=indent)`` on the
+    parsed document.  An opening bracket is held back until the next event
+    shows whether the container is empty (``{}``/``[]``) or not.  Output is
+    passed to ``write`` in joined batches of ``batch_size`` pieces.
+    
+    The events carry every value of a repeated key, where parsing keeps
+    only the last, so the keys of each open object are tracked and the
+    output stops at the first repeat.  Returns True if the whole document
+    was written, False if it stopped at a repeated key.
+    """
+    unit = ' ' * indent if isinstance(indent, int) else indent
+    encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+    newlines = ['\n']
+    
+    parts: List[str] = []
+    append = parts.append
+    depth = 0
+    pending = None  # Opening bracket not yet written
+    after_key = False
+    key_sets: List[Set[str]] = []  # Keys seen in each open object
+    
+    for event, value in events:
+        if event == 'end_map' or event == 'end_array':
+            depth -= 1
+            if event == 'end_map':
+                key_sets.pop()
+            if pending is not None:
+                append('{}' if pending == '{' else '[]')
+                pending = None
+            else:
+                append(newlines[depth])
+                append('}' if event == 'end_map' else ']')
+        else:
+            # Everything else starts a key or a value: emit what precedes it
+            if after_key:
+                after_key = False
+            elif pending is not None:
+                append(pending)
+                append(newlines[depth])
+                pending = None
+            elif depth:
+                append(',')
+                append(newlines[depth])
+            
+            if event == 'map_key':
+                keys = key_sets[-1]
+                if value in keys:
+                    return False
+                keys.add(value)
+                append(encode_str(value))
+                append(': ')
+                after_key = True
+            elif event == 'start_map' or event == 'start_array':
+                if event == 'start_map':
+                    pending = '{'
+                    key_sets.append(set())
+                else:
+                    pending = '['
+                depth += 1
+                if depth == len(newlines):
+                    newlines.append(newlines[-1] + unit)
+            elif event == 'string':
+                append(encode_str(value))
+            elif event == 'number':
+                if type(value) is Decimal:
+                    append(_float_repr(float(value)))
+                else:
+                    append(int.__repr__(value))
+            elif event == 'boolean':
+                append('true' if value else 'false')
+            else:
+                append('null')
+        
+        if len(parts) >= batch_size:
+            write(''.join(parts))
+            parts.clear()
     
-    return formatted
+    write(''.join(parts))
+    return True
+
+
+def _stream_format_file(
+    input_path: str,
+    output_path: str,
+    chunk_size: int,
+    options: Dict[str, Any]
+) -> bool:
+    """
+    Format a large file through ijson when ``format_json`` would produce
+    the layout, without holding the document in memory.
+    
+    Output goes to a temporary file beside ``output_path`` that replaces it
+    only once the whole document has been written, so the input may also be
+    the output; a symlinked ``output_path`` keeps its link, as the file it
+    points to is the one replaced.  Returns False without touching
+    ``output_path`` when the options need the in-memory path (sorted keys,
+    compact or custom separators) or the document is not plain JSON
+    (``NaN``, a BOM, vertical tabs or form feeds, which yajl would skip as
+    whitespace, invalid UTF-8 or other errors) or repeats a key within an
+    object; the caller then formats in memory, keeping the last value of a
+    repeated key, and reports any error as usual.
+    """
+    indent = options.get('indent', 2)
+    if (
+        not _STREAMABLE_OPTIONS.issuperset(options)
+        or options.get('sort_keys') or options.get('compact')
+        or options.get('separators') is not None
+        or not (isinstance(indent, str) or (type(indent) is int and indent >= 0))
+        or os.path.getsize(input_path) < STREAM_MIN_SIZE
+    ):
+        return False
+    
+    # format_json rejects these words anywhere in the text, even in strings,
+    # and JSON allows vertical tabs and form feeds nowhere
+    with open(input_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for word in (b'Infinity', b'NaN', b'\x0b', b'\x0c'):
+                if mm.find(word) != -1:
+                    return False
+    
+    try:
+        # Only needed for large files, so not imported with the module
+        import ijson
+    except ImportError:  # pragma: no cover - optional speedup
+        return False
+    
+    output_path = os.path.realpath(output_path)
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        out = open(temp_path, 'x', buffering=STREAM_BUFFER_SIZE, encoding='utf-8', newline='')
+    except FileExistsError:
+        return False
+    try:
+        with out, open(input_path, 'rb') as f:
+            events = ijson.basic_parse(f, buf_size=chunk_size)
+            complete = _stream_format(
+                events, out.write, indent, options.get('ensure_ascii', True)
+            )
+        if not complete:
+            os.remove(temp_path)
+            return False
+        if os.path.exists(output_path):
+            shutil.copymode(output_path, temp_path)
+        os.replace(temp_path, output_path)
+    except (ijson.JSONError, UnicodeDecodeError):
+        # Strings are decoded as they are read, so e.g. encoded surrogates
+        # surface as UnicodeDecodeError rather than a parse error
+        os.remove(temp_path)
+        return False
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return True
+
+
+def _is_binary_file(file: Any) -> bool:
+    """Whether a file object reads and writes bytes rather than str."""
+    if isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    mode = getattr(file, 'mode', '')
+    return isinstance(mode, str) and 'b' in mode
 
 
 def format_json_stream(
-    input_file: Union[str, IO[str]],
-    output_file: Optional[Union[str, IO[str]]] = None,
+    input_file: Union[str, IO[str], IO[bytes]],
+    output_file: Optional[Union[str, IO[str], IO[bytes]]] = None,
     chunk_size: int = 8192,
-    **kwargs
+    **kwargs: Any
 ) -> None:
     """
     Format JSON from a file using streaming for memory efficiency.
@@ -96,8 +601,9 @@ def format_json_stream(
     without loading the entire content into memory at once.
     
     Args:
-        input_file: Path to input file or file object
-        output_file: Path to output file or file object (if None, overwrites input)
+        input_file: Path to input file or text or binary file object
+        output_file: Path to output file or text or binary file object
+            (if None, overwrites input)
         chunk_size: Size of chunks to read at a time
         **kwargs: Additional arguments passed to format_json()
         
@@ -107,18 +613,31 @@ def format_json_stream(
         IOError: If there are file I/O errors
     """
     # Handle file paths vs file objects
+    content: Union[str, bytes]
     if isinstance(input_file, str):
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Input file not found: {input_file}")
         
-        with open(input_file, 'r', encoding='utf-8') as f:
+        # Large files between paths are formatted without loading them
+        target = input_file if output_file is None else output_file
+        if isinstance(target, str) and _stream_format_file(
+            input_file, target, chunk_size, kwargs
+        ):
+            return
+        
+        # Files stay bytes end to end so format_json_bytes can skip decoding
+        with open(input_file, 'rb') as f:
             content = f.read()
     else:
         content = input_file.read()
     
     # Parse and format the JSON
+    formatted: Union[str, bytes]
     try:
-        formatted = format_json(content, **kwargs)
+        if isinstance(content, bytes):
+            formatted = format_json_bytes(content, **kwargs)
+        else:
+            formatted = format_json(content, **kwargs)
     except (json.JSONDecodeError, ValueError) as e:
         raise e
     
@@ -127,7 +646,15 @@ def format_json_stream(
         output_file = input_file
     
     if isinstance(output_file, str):
-        with open(output_file, 'w', encoding='utf-8') as f:
+        if isinstance(formatted, str):
+            formatted = formatted.encode('utf-8')
+        with open(output_file, 'wb') as f:
             f.write(formatted)
+    elif _is_binary_file(output_file):
+        if isinstance(formatted, str):
+            formatted = formatted.encode('utf-8')
+        cast(IO[bytes], output_file).write(formatted)
     else:
-        output_file.write(formatted)
\ No newline at end of file
+        if isinstance(formatted, bytes):
+            formatted = formatted.decode('utf-8')
+        cast(IO[str], output_file).write(formatted)
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Core functionality for JSON prettification."""
 
 import json
-from typing import Any, Union
+from typing import Any, Literal, Union
+
+from .formatter import _fast_dumps, _fast_loads
 
 
 def prettify_json(
@@ -9,6 +11,7 @@ def prettify_json(
     indent: int = 2,
     sort_keys: bool = False,
     compact: bool = False,
+    ensure_ascii: bool = False,
 ) -> str:
     """Prettify JSON string with specified formatting options.
 
@@ -17,6 +20,8 @@ def prettify_json(
         indent: Number of spaces for indentation (default: 2)
         sort_keys: Whether to sort object keys alphabetically (default: False)
         compact: Whether to output compact JSON (default: False)
+        ensure_ascii: Whether to escape non-ASCII characters as \\uXXXX
+            (default: False)
 
     Returns:
         Prettified JSON string
@@ -25,21 +30,38 @@ def prettify_json(
         json.JSONDecodeError: If the input is not valid JSON
     """
     # Parse JSON
-    data = json.loads(json_str)
+    data = _fast_loads(json_str)
 
     # Format JSON based on options
     if compact:
-        return json.dumps(data, separators=(",", ":"), sort_keys=sort_keys)
+        return _fast_dumps(
+            data,
+            separators=(",", ":"),
+            sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii and not _is_ascii_text(json_str),
+            source=json_str,
+        )
     else:
-        return json.dumps(
+        return _fast_dumps(
             data,
             indent=indent,
             sort_keys=sort_keys,
-            ensure_ascii=False,
+            ensure_ascii=ensure_ascii and not _is_ascii_text(json_str),
+            source=json_str,
         )
 
 
-def validate_json(json_str: str) -> Union[bool, str]:
+def _is_ascii_text(json_str: str) -> bool:
+    """Return True if the parsed text can only hold ASCII strings without DEL.
+
+    ``ensure_ascii`` then changes nothing (it escapes DEL as ``\\u007f``),
+    so the accelerated backends, which only write UTF-8, produce the same
+    output as the stdlib.
+    """
+    return json_str.isascii() and "\\u" not in json_str and "\x7f" not in json_str
+
+
+def validate_json(json_str: str) -> Union[Literal[True], str]:
     """Validate if a string is valid JSON.
 
     Args:
@@ -49,7 +71,7 @@ def validate_json(json_str: str) -> Union[bool, str]:
         True if valid JSON, error message string if invalid
     """
     try:
-        json.loads(json_str)
+        _fast_loads(json_str)
         return True
     except json.JSONDecodeError as e:
         return f"Invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}"
@@ -67,5 +89,10 @@ def minify_json(json_str: str) -> str:
     Raises:
         json.JSONDecodeError: If the input is not valid JSON
     """
-    data = json.loads(json_str)
-    return json.dumps(data, separators=(",", ":"))
\ No newline at end of file
+    data = _fast_loads(json_str)
+    return _fast_dumps(
+        data,
+        separators=(",", ":"),
+        ensure_ascii=not _is_ascii_text(json_str),
+        source=json_str,
+    )
\ No newline at end of file
@@ -1,11 +1,37 @@
 """JSON Schema validation functionality."""
 
 import json
-from typing import Dict, List, Optional, Union, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Union
 from pathlib import Path
 import jsonschema
 from jsonschema import Draft7Validator, ValidationError as SchemaValidationError
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional speedup
+    fastjsonschema = None
+
+
+# Message builders for common schema keywords, keyed by ``error.validator``
+_ERROR_FORMATTERS: Dict[str, Callable[[SchemaValidationError, str], str]] = {
+    'required': lambda e, path: f"Missing required property '{e.validator_value[0]}' at root{path}",
+    'type': lambda e, path: f"Invalid type at root{path}: expected {e.validator_value}, got {type(e.instance).__name__}",
+    'enum': lambda e, path: f"Invalid value at root{path}: must be one of {e.validator_value}",
+    'pattern': lambda e, path: f"String at root{path} does not match pattern '{e.validator_value}'",
+    'minLength': lambda e, path: f"String at root{path} is too short (minimum length: {e.validator_value})",
+    'maxLength': lambda e, path: f"String at root{path} is too long (maximum length: {e.validator_value})",
+    'minimum': lambda e, path: f"Number at root{path} is below minimum ({e.validator_value})",
+    'maximum': lambda e, path: f"Number at root{path} exceeds maximum ({e.validator_value})",
+    'minItems': lambda e, path: f"Array at root{path} has too few items (minimum: {e.validator_value})",
+    'maxItems': lambda e, path: f"Array at root{path} has too many items (maximum: {e.validator_value})",
+    'additionalProperties': lambda e, path: f"Additional property not allowed at root{path}",
+}
+
+# Keywords fastjsonschema checks more loosely than Draft7Validator: it takes
+# 0.3 as a multiple of 0.1 and divides integers beyond 2**53 as floats
+_LOOSE_FAST_KEYWORDS = frozenset(('multipleOf',))
+
 
 class SchemaValidator:
     """Validates JSON data against JSON schemas."""
@@ -14,18 +40,25 @@ class SchemaValidator:
         """Initialize validator with schema."""
         self.schema = schema
         self.validator = Draft7Validator(schema)
+        self._fast = _compile_fast(schema)
     
     @classmethod
     def from_file(cls, schema_path: Path, encoding: str = 'utf-8') -> 'SchemaValidator':
-        """Create validator from schema file."""
+        """
+        Create validator from schema file.
+        
+        Parsed schemas are cached by resolved path, modification time and
+        encoding, and their compiled checks by content, so checking many
+        documents against one schema reads and compiles it only once while
+        edits to the file are still picked up.  Each call returns a new
+        instance of ``cls``.
+        """
         try:
-            with open(schema_path, 'r', encoding=encoding) as f:
-                schema = json.load(f)
-            return cls(schema)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in schema file: {e}")
+            path = Path(schema_path).resolve()
+            mtime_ns = path.stat().st_mtime_ns
         except Exception as e:
             raise ValueError(f"Error loading schema file: {e}")
+        return cls(_load_schema(str(path), mtime_ns, encoding))
     
     def validate(self, data: Any) -> List[str]:
         """
@@ -34,36 +67,22 @@ class SchemaValidator:
         Returns:
             List of error messages (empty if valid)
         """
+        # The generated validator only answers "valid or not"; the
+        # jsonschema walk below is kept for reporting every error.
+        if self._fast_accepts(data):
+            return []
+        
         errors = []
         for error in self.validator.iter_errors(data):
             # Build error path
             path = ""
             if error.path:
-                path = "." + ".".join(str(p) for p in error.path)
+                path = "." + ".".join(map(str, error.path))
             
             # Format error message
-            if error.validator == 'required':
-                errors.append(f"Missing required property '{error.validator_value[0]}' at root{path}")
-            elif error.validator == 'type':
-                errors.append(f"Invalid type at root{path}: expected {error.validator_value}, got {type(error.instance).__name__}")
-            elif error.validator == 'enum':
-                errors.append(f"Invalid value at root{path}: must be one of {error.validator_value}")
-            elif error.validator == 'pattern':
-                errors.append(f"String at root{path} does not match pattern '{error.validator_value}'")
-            elif error.validator == 'minLength':
-                errors.append(f"String at root{path} is too short (minimum length: {error.validator_value})")
-            elif error.validator == 'maxLength':
-                errors.append(f"String at root{path} is too long (maximum length: {error.validator_value})")
-            elif error.validator == 'minimum':
-                errors.append(f"Number at root{path} is below minimum ({error.validator_value})")
-            elif error.validator == 'maximum':
-                errors.append(f"Number at root{path} exceeds maximum ({error.validator_value})")
-            elif error.validator == 'minItems':
-                errors.append(f"Array at root{path} has too few items (minimum: {error.validator_value})")
-            elif error.validator == 'maxItems':
-                errors.append(f"Array at root{path} has too many items (maximum: {error.validator_value})")
-            elif error.validator == 'additionalProperties':
-                errors.append(f"Additional property not allowed at root{path}")
+            formatter = _ERROR_FORMATTERS.get(error.validator)
+            if formatter is not None:
+                errors.append(formatter(error, path))
             else:
                 errors.append(f"Schema validation error at root{path}: {error.message}")
         
@@ -71,7 +90,78 @@ class SchemaValidator:
     
     def is_valid(self, data: Any) -> bool:
         """Check if data is valid against schema."""
-        return self.validator.is_valid(data)
+        return self._fast_accepts(data) or self.validator.is_valid(data)
+    
+    def _fast_accepts(self, data: Any) -> bool:
+        """Return True if the compiled fastjsonschema function accepts data."""
+        if self._fast is None:
+            return False
+        try:
+            self._fast(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+
+def _compile_fast(schema: Dict[str, Any]) -> Optional[Any]:
+    """
+    Compile schema with fastjsonschema, or return None if unavailable.
+    
+    Defaults and format checks are disabled to match Draft7Validator, which
+    neither mutates data nor asserts formats.  Schemas fastjsonschema cannot
+    compile, or would accept more data for than jsonschema, are left to
+    jsonschema alone.  The compiled functions hold no state, so equal
+    schemas share one, cached by their canonical JSON text.
+    """
+    if fastjsonschema is None or _uses_keywords(schema, _LOOSE_FAST_KEYWORDS):
+        return None
+    try:
+        text = json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return _compile_fast_text(text)
+
+
+@lru_cache(maxsize=256)
+def _compile_fast_text(text: str) -> Optional[Any]:
+    """Compile the schema serialized as ``text``, or return None on failure."""
+    try:
+        return fastjsonschema.compile(json.loads(text), use_default=False, use_formats=False)
+    except Exception:
+        return None
+
+
+def _uses_keywords(schema: Any, keywords: frozenset) -> bool:
+    """Return True if ``schema`` or any subschema has one of ``keywords``."""
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if not keywords.isdisjoint(node):
+                return True
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return False
+
+
+@lru_cache(maxsize=256)
+def _load_schema(path_str: str, mtime_ns: int, encoding: str) -> Dict[str, Any]:
+    """Load a schema file; ``mtime_ns`` only serves as cache key."""
+    try:
+        with open(path_str, 'r', encoding=encoding) as f:
+            schema: Dict[str, Any] = json.load(f)
+        return schema
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in schema file: {e}")
+    except Exception as e:
+        raise ValueError(f"Error loading schema file: {e}")
+
+
+def clear_schema_cache() -> None:
+    """Forget all cached schemas and compiled checks."""
+    _load_schema.cache_clear()
+    _compile_fast_text.cache_clear()
 
 
 def validate_against_schema(
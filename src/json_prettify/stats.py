@@ -1,14 +1,44 @@
 """JSON statistics calculation functionality."""
 
+import heapq
 import json
-from typing import Dict, Any, List, Tuple, Union
+import sys
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple, Union
 from collections import defaultdict
+from itertools import repeat
+from operator import itemgetter
 from dataclasses import dataclass
 
+from .formatter import _fast_loads, _get_encoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
+
+# Documents from this size up are counted from parser events rather than a
+# parsed tree; below it building the tree with orjson is faster
+STREAM_MIN_SIZE = 1024 * 1024
+
 
 @dataclass
 class JSONStats:
     """Statistics about a JSON document."""
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "total_size", "total_keys", "unique_keys", "max_depth",
+        "total_strings", "total_numbers", "total_booleans", "total_nulls",
+        "total_arrays", "total_objects",
+        "array_length_sum", "array_length_min", "array_length_max",
+        "string_length_sum", "string_length_min", "string_length_max",
+        "key_frequencies",
+    )
+    
     total_size: int  # Size in bytes
     total_keys: int  # Total number of object keys
     unique_keys: int  # Number of unique keys
@@ -19,8 +49,12 @@ class JSONStats:
     total_nulls: int
     total_arrays: int
     total_objects: int
-    array_lengths: List[int]  # Lengths of all arrays
-    string_lengths: List[int]  # Lengths of all strings
+    array_length_sum: int  # Sum, min and max of all array lengths
+    array_length_min: int
+    array_length_max: int
+    string_length_sum: int  # Sum, min and max of all string lengths
+    string_length_min: int
+    string_length_max: int
     key_frequencies: Dict[str, int]  # Frequency of each key
     
     def get_summary(self) -> Dict[str, Any]:
@@ -41,46 +75,79 @@ class JSONStats:
         }
         
         # Add array statistics if any
-        if self.array_lengths:
+        if self.total_arrays:
             summary["arrays_info"] = {
-                "count": len(self.array_lengths),
-                "avg_length": sum(self.array_lengths) / len(self.array_lengths),
-                "max_length": max(self.array_lengths),
-                "min_length": min(self.array_lengths)
+                "count": self.total_arrays,
+                "avg_length": self.array_length_sum / self.total_arrays,
+                "max_length": self.array_length_max,
+                "min_length": self.array_length_min
             }
         
         # Add string statistics if any
-        if self.string_lengths:
+        if self.total_strings:
             summary["strings_info"] = {
-                "count": len(self.string_lengths),
-                "avg_length": sum(self.string_lengths) / len(self.string_lengths),
-                "max_length": max(self.string_lengths),
-                "min_length": min(self.string_lengths)
+                "count": self.total_strings,
+                "avg_length": self.string_length_sum / self.total_strings,
+                "max_length": self.string_length_max,
+                "min_length": self.string_length_min
             }
         
         # Add top 10 most frequent keys
         if self.key_frequencies:
-            sorted_keys = sorted(
-                self.key_frequencies.items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )
-            summary["top_keys"] = dict(sorted_keys[:10])
+            summary["top_keys"] = dict(_top_keys(self.key_frequencies))
         
         return summary
 
 
+def _top_keys(key_frequencies: Dict[str, int], n: int = 10) -> List[Tuple[str, int]]:
+    """The n most frequent keys, ties kept in the order first seen in the document.
+    
+    Same result as a full descending sort cut to n, in O(k log n).
+    """
+    return heapq.nlargest(n, key_frequencies.items(), key=itemgetter(1))
+
+
+# Key of stack entries for array items and the root, which have none
+_NO_KEY = object()
+
+# Exact types json.loads produces
+_JSON_TYPES = frozenset((dict, list, str, int, float, bool, type(None)))
+
+
+def _json_type(value: Any) -> Optional[type]:
+    """Map a subclass of a JSON type (e.g. OrderedDict) to that type.
+    
+    Returns None for values with no JSON equivalent, which are not counted.
+    bool is checked before int because it subclasses it.
+    """
+    for json_type in (bool, dict, list, str, int, float):
+        if isinstance(value, json_type):
+            return json_type
+    return None
+
+
+def _compact_size(data: Any) -> int:
+    """Size in bytes of compact UTF-8 JSON for parsed data."""
+    if orjson is not None:
+        try:
+            # orjson writes UTF-8 bytes directly, with no intermediate str
+            return len(orjson.dumps(data))
+        except orjson.JSONEncodeError:
+            # Non-string keys, integers beyond 64 bits or very deep nesting
+            pass
+    return len(_get_encoder(None, False, False, (',', ':')).encode(data).encode('utf-8'))
+
+
 class JSONStatsCalculator:
     """Calculates statistics for JSON data."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the calculator."""
         self.reset()
     
-    def reset(self):
+    def reset(self) -> None:
         """Reset all statistics."""
         self.total_keys = 0
-        self.unique_keys = set()
         self.max_depth = 0
         self.total_strings = 0
         self.total_numbers = 0
@@ -88,9 +155,13 @@ class JSONStatsCalculator:
         self.total_nulls = 0
         self.total_arrays = 0
         self.total_objects = 0
-        self.array_lengths = []
-        self.string_lengths = []
-        self.key_frequencies = defaultdict(int)
+        self.array_length_sum = 0
+        self.array_length_min = sys.maxsize
+        self.array_length_max = 0
+        self.string_length_sum = 0
+        self.string_length_min = sys.maxsize
+        self.string_length_max = 0
+        self.key_frequencies: Dict[Any, int] = {}
     
     def calculate(self, json_data: Union[str, Dict, List]) -> JSONStats:
         """
@@ -106,23 +177,24 @@ class JSONStatsCalculator:
         
         # Parse JSON if string
         if isinstance(json_data, str):
-            try:
-                data = json.loads(json_data)
-                size_bytes = len(json_data.encode('utf-8'))
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON: {e}")
+            raw = json_data.encode('utf-8')
+            size_bytes = len(raw)
+            if size_bytes < STREAM_MIN_SIZE or not self._analyze_events(raw):
+                try:
+                    # Values are only counted, so exact integers are not needed
+                    data = _fast_loads(json_data, exact=False)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON: {e}")
+                self._analyze(data)
         else:
-            data = json_data
-            # Estimate size by converting back to JSON
-            size_bytes = len(json.dumps(data, ensure_ascii=False).encode('utf-8'))
-        
-        # Calculate statistics
-        self._analyze_value(data, depth=0)
+            # Estimate size by converting back to compact JSON
+            size_bytes = _compact_size(json_data)
+            self._analyze(json_data)
         
         return JSONStats(
             total_size=size_bytes,
             total_keys=self.total_keys,
-            unique_keys=len(self.unique_keys),
+            unique_keys=len(self.key_frequencies),
             max_depth=self.max_depth,
             total_strings=self.total_strings,
             total_numbers=self.total_numbers,
@@ -130,41 +202,199 @@ class JSONStatsCalculator:
             total_nulls=self.total_nulls,
             total_arrays=self.total_arrays,
             total_objects=self.total_objects,
-            array_lengths=self.array_lengths,
-            string_lengths=self.string_lengths,
+            array_length_sum=self.array_length_sum,
+            array_length_min=self.array_length_min if self.total_arrays else 0,
+            array_length_max=self.array_length_max,
+            string_length_sum=self.string_length_sum,
+            string_length_min=self.string_length_min if self.total_strings else 0,
+            string_length_max=self.string_length_max,
             key_frequencies=dict(self.key_frequencies)
         )
     
-    def _analyze_value(self, value: Any, depth: int):
-        """Recursively analyze a JSON value."""
-        self.max_depth = max(self.max_depth, depth)
+    def _analyze(self, root: Any) -> None:
+        """Analyze a JSON value and everything nested in it.
         
-        if isinstance(value, dict):
-            self.total_objects += 1
-            for key, val in value.items():
-                self.total_keys += 1
-                self.unique_keys.add(key)
-                self.key_frequencies[key] += 1
-                self._analyze_value(val, depth + 1)
+        Walks the tree with a stack of child iterators instead of recursion,
+        so deep documents cannot hit the recursion limit, while costing one
+        push per container rather than one entry per value.  Children are
+        visited and keys first seen in document order, as when streaming
+        parser events.  Scalars are tallied per exact type and turned into
+        totals at the end.
+        """
+        key_frequencies = self.key_frequencies
+        get = key_frequencies.get
+        type_counts: DefaultDict[Optional[type], int] = defaultdict(int)
+        total_keys = 0
+        total_objects = 0
+        total_arrays = 0
+        array_sum = self.array_length_sum
+        array_min = self.array_length_min
+        array_max = self.array_length_max
+        string_sum = self.string_length_sum
+        string_min = self.string_length_min
+        string_max = self.string_length_max
+        max_depth = self.max_depth
         
-        elif isinstance(value, list):
-            self.total_arrays += 1
-            self.array_lengths.append(len(value))
-            for item in value:
-                self._analyze_value(item, depth + 1)
+        # Each open container holds an iterator over its (key, value) pairs;
+        # the values of the top one are at the current depth
+        stack = [iter(((_NO_KEY, root),))]
+        push = stack.append
+        pop = stack.pop
+        depth = 0
+        while stack:
+            for key, value in stack[-1]:
+                if key is not _NO_KEY:
+                    key_frequencies[key] = get(key, 0) + 1
+                if depth > max_depth:
+                    max_depth = depth
+                
+                value_type: Optional[type] = type(value)
+                if value_type not in _JSON_TYPES:
+                    value_type = _json_type(value)
+                
+                if value_type is dict:
+                    total_objects += 1
+                    total_keys += len(value)
+                    push(iter(value.items()))
+                    depth += 1
+                    break
+                
+                if value_type is list:
+                    total_arrays += 1
+                    length = len(value)
+                    array_sum += length
+                    if length < array_min:
+                        array_min = length
+                    if length > array_max:
+                        array_max = length
+                    push(zip(repeat(_NO_KEY), value))
+                    depth += 1
+                    break
+                
+                if value_type is str:
+                    length = len(value)
+                    string_sum += length
+                    if length < string_min:
+                        string_min = length
+                    if length > string_max:
+                        string_max = length
+                type_counts[value_type] += 1
+            else:
+                pop()
+                depth -= 1
         
-        elif isinstance(value, str):
-            self.total_strings += 1
-            self.string_lengths.append(len(value))
+        self.total_keys += total_keys
+        self.total_objects += total_objects
+        self.total_arrays += total_arrays
+        self.max_depth = max_depth
+        self.array_length_sum = array_sum
+        self.array_length_min = array_min
+        self.array_length_max = array_max
+        self.string_length_sum = string_sum
+        self.string_length_min = string_min
+        self.string_length_max = string_max
+        self.total_strings += type_counts[str]
+        self.total_numbers += type_counts[int] + type_counts[float]
+        self.total_booleans += type_counts[bool]
+        self.total_nulls += type_counts[type(None)]
+    
+    def _analyze_events(self, raw: bytes) -> bool:
+        """Analyze UTF-8 JSON from ijson parser events, without a parsed tree.
+        
+        Memory stays proportional to nesting depth and the keys of open
+        objects.  Each open container has an entry on the stack: the running
+        length for arrays, the set of keys seen so far for objects.  Returns
+        False, leaving the calculator reset, if ijson is not installed or
+        rejects the document, the document holds a vertical tab or form feed
+        (invalid anywhere in JSON, but skipped as whitespace by yajl), or an
+        object repeats a key (parsing keeps only its last value, so earlier
+        ones must not be counted), so the caller can fall back to parsing it.
+        """
+        if ijson is None or b'\x0b' in raw or b'\x0c' in raw:
+            return False
         
-        elif isinstance(value, (int, float)):
-            self.total_numbers += 1
+        key_frequencies = self.key_frequencies
+        get = key_frequencies.get
+        total_keys = 0
+        total_objects = 0
+        total_arrays = 0
+        array_sum = self.array_length_sum
+        array_min = self.array_length_min
+        array_max = self.array_length_max
+        string_sum = self.string_length_sum
+        string_min = self.string_length_min
+        string_max = self.string_length_max
+        max_depth = self.max_depth
+        event_counts: DefaultDict[str, int] = defaultdict(int)
         
-        elif isinstance(value, bool):
-            self.total_booleans += 1
+        stack: List[Any] = []
+        push = stack.append
+        pop = stack.pop
+        try:
+            for event, value in ijson.basic_parse(raw):
+                if event == 'map_key':
+                    keys = stack[-1]
+                    if value in keys:
+                        self.reset()
+                        return False
+                    keys.add(value)
+                    key_frequencies[value] = get(value, 0) + 1
+                    total_keys += 1
+                    continue
+                if event == 'end_map':
+                    pop()
+                    continue
+                if event == 'end_array':
+                    length = pop()
+                    array_sum += length
+                    if length < array_min:
+                        array_min = length
+                    if length > array_max:
+                        array_max = length
+                    continue
+                
+                # Every other event starts a value one level below its parent
+                depth = len(stack)
+                if depth:
+                    if depth > max_depth:
+                        max_depth = depth
+                    if type(stack[-1]) is int:
+                        stack[-1] += 1
+                
+                if event == 'start_map':
+                    total_objects += 1
+                    push(set())
+                elif event == 'start_array':
+                    total_arrays += 1
+                    push(0)
+                else:
+                    if event == 'string':
+                        length = len(value)
+                        string_sum += length
+                        if length < string_min:
+                            string_min = length
+                        if length > string_max:
+                            string_max = length
+                    event_counts[event] += 1
+        except ijson.JSONError:
+            self.reset()
+            return False
         
-        elif value is None:
-            self.total_nulls += 1
+        self.total_keys += total_keys
+        self.total_objects += total_objects
+        self.total_arrays += total_arrays
+        self.max_depth = max_depth
+        self.array_length_sum = array_sum
+        self.array_length_min = array_min
+        self.array_length_max = array_max
+        self.string_length_sum = string_sum
+        self.string_length_min = string_min
+        self.string_length_max = string_max
+        self.total_strings += event_counts['string']
+        self.total_numbers += event_counts['number']
+        self.total_booleans += event_counts['boolean']
+        self.total_nulls += event_counts['null']
+        return True
 
 
 def calculate_json_stats(json_data: Union[str, Dict, List]) -> JSONStats:
@@ -192,56 +422,52 @@ def format_stats_output(stats: JSONStats, no_color: bool = False) -> str:
     Returns:
         Formatted statistics string
     """
-    summary = stats.get_summary()
     lines = []
     
     # Basic stats
     lines.append("=== JSON Statistics ===")
-    lines.append(f"Size: {summary['size_bytes']:,} bytes")
-    lines.append(f"Maximum depth: {summary['depth']}")
+    lines.append(f"Size: {stats.total_size:,} bytes")
+    lines.append(f"Maximum depth: {stats.max_depth}")
     lines.append("")
     
     # Type counts
     lines.append("Type counts:")
-    counts = summary['counts']
-    lines.append(f"  Objects: {counts['objects']:,}")
-    lines.append(f"  Arrays: {counts['arrays']:,}")
-    lines.append(f"  Strings: {counts['strings']:,}")
-    lines.append(f"  Numbers: {counts['numbers']:,}")
-    lines.append(f"  Booleans: {counts['booleans']:,}")
-    lines.append(f"  Nulls: {counts['nulls']:,}")
+    lines.append(f"  Objects: {stats.total_objects:,}")
+    lines.append(f"  Arrays: {stats.total_arrays:,}")
+    lines.append(f"  Strings: {stats.total_strings:,}")
+    lines.append(f"  Numbers: {stats.total_numbers:,}")
+    lines.append(f"  Booleans: {stats.total_booleans:,}")
+    lines.append(f"  Nulls: {stats.total_nulls:,}")
     lines.append("")
     
     # Key statistics
     lines.append("Key statistics:")
-    lines.append(f"  Total keys: {counts['total_keys']:,}")
-    lines.append(f"  Unique keys: {counts['unique_keys']:,}")
+    lines.append(f"  Total keys: {stats.total_keys:,}")
+    lines.append(f"  Unique keys: {stats.unique_keys:,}")
     
     # Array info if present
-    if 'arrays_info' in summary:
-        info = summary['arrays_info']
+    if stats.total_arrays:
         lines.append("")
         lines.append("Array statistics:")
-        lines.append(f"  Count: {info['count']:,}")
-        lines.append(f"  Average length: {info['avg_length']:.1f}")
-        lines.append(f"  Min length: {info['min_length']:,}")
-        lines.append(f"  Max length: {info['max_length']:,}")
+        lines.append(f"  Count: {stats.total_arrays:,}")
+        lines.append(f"  Average length: {stats.array_length_sum / stats.total_arrays:.1f}")
+        lines.append(f"  Min length: {stats.array_length_min:,}")
+        lines.append(f"  Max length: {stats.array_length_max:,}")
     
     # String info if present
-    if 'strings_info' in summary:
-        info = summary['strings_info']
+    if stats.total_strings:
         lines.append("")
         lines.append("String statistics:")
-        lines.append(f"  Count: {info['count']:,}")
-        lines.append(f"  Average length: {info['avg_length']:.1f}")
-        lines.append(f"  Min length: {info['min_length']:,}")
-        lines.append(f"  Max length: {info['max_length']:,}")
+        lines.append(f"  Count: {stats.total_strings:,}")
+        lines.append(f"  Average length: {stats.string_length_sum / stats.total_strings:.1f}")
+        lines.append(f"  Min length: {stats.string_length_min:,}")
+        lines.append(f"  Max length: {stats.string_length_max:,}")
     
     # Top keys
-    if 'top_keys' in summary and summary['top_keys']:
+    if stats.key_frequencies:
         lines.append("")
         lines.append("Most frequent keys:")
-        for key, count in list(summary['top_keys'].items())[:10]:
+        for key, count in _top_keys(stats.key_frequencies):
             lines.append(f"  '{key}': {count:,} occurrences")
     
-    return "\n".join(lines)
\ No newline at end of file
+    return "\n".join(lines)
@@ -1,10 +1,51 @@
 """JSON validation functionality with detailed error reporting."""
 
+import codecs
 import json
+import mmap
 import os
-from typing import List, Optional, Tuple, Union
+import re
+import stat
+import threading
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, BinaryIO, Dict, List, Literal, Optional, Tuple, Union
 from dataclasses import dataclass
 
+from .formatter import _fast_loads
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional speedup
+    simdjson = None  # type: ignore[assignment]
+
+# Documents up to this size are checked by a simdjson parser kept per
+# thread; it keeps buffers sized for the largest document it has seen, so
+# bigger ones get a parser of their own that is freed afterwards
+_SHARED_PARSER_MAX_SIZE = 1024 * 1024
+_thread_state = threading.local()
+
+# Files up to this size are checked by simdjson, whose native buffers grow to
+# a few times the input; larger files are streamed through ijson
+SIMDJSON_MAX_SIZE = 256 * 1024 * 1024
+
+# Files above this size that simdjson cannot take are streamed, not parsed
+# into a tree
+STREAM_MIN_SIZE = 1024 * 1024
+
+# Files up to this size are read with a single read() on a raw descriptor;
+# a file object or memory map costs more to set up than the copy it saves
+SMALL_FILE_SIZE = 64 * 1024
+
+# Validators return exactly True for valid input, never False, so callers
+# can test the result with ``is True``; anything else is the error message
+ValidationResult = Union[Literal[True], str]
+
 
 @dataclass
 class ValidationError:
@@ -55,31 +96,76 @@ class JSONValidationError(Exception):
         return " ".join(parts)
 
 
+class _DuplicateKeyError(ValueError):
+    """Raised while parsing when an object repeats a key."""
+    
+    def __init__(self, key: str):
+        super().__init__(key)
+        self.key = key
+
+
+def _reject_duplicate_keys(pairs: List[Tuple[str, Any]]) -> None:
+    """``object_pairs_hook`` that raises on the first repeated key."""
+    if len({key for key, _ in pairs}) != len(pairs):
+        seen = set()
+        for key, _ in pairs:
+            if key in seen:
+                raise _DuplicateKeyError(key)
+            seen.add(key)
+    # The parsed value is discarded, so no dict needs to be built
+
+
+# First line whose content ends in a comma directly before a closing bracket
+_TRAILING_COMMA_RE = re.compile(r',[}\]]\s*$', re.MULTILINE)
+
+
+# Kinds of json.JSONDecodeError message that get a friendlier description
+_DECODE_ERROR_KIND_RE = re.compile(
+    r"(?P<delimiter>expecting.*delimiter)|(?P<escape>invalid.*escape)"
+    r"|(?P<value>expecting value)|(?P<extra>extra data)",
+    re.IGNORECASE
+)
+
+_DETAILED_MESSAGES: Dict[Optional[str], str] = {
+    'delimiter': "Missing comma between elements",
+    'escape': "Invalid escape sequence in string",
+    'value': "Expected a value but found invalid token",
+    'extra': "Extra data after valid JSON",
+}
+
+
+def _decode_error_kind(msg: str) -> Optional[str]:
+    """Classify a JSONDecodeError message in one regex search."""
+    match = _DECODE_ERROR_KIND_RE.search(msg)
+    return match.lastgroup if match else None
+
+
 def _get_line_and_column(text: str, pos: int) -> Tuple[int, int]:
     """Get line and column number from position in text."""
-    lines = text[:pos].split('\n')
-    line = len(lines)
-    column = len(lines[-1]) + 1 if lines else 1
+    # Scans in place instead of copying and splitting text[:pos]
+    line = text.count('\n', 0, pos) + 1
+    column = pos - text.rfind('\n', 0, pos)
     return line, column
 
 
 def _check_common_errors(json_string: str) -> Optional[str]:
     """Check for common JSON syntax errors."""
-    if not json_string.strip():
+    stripped = json_string.strip()
+    if not stripped:
         return "Empty or whitespace-only input"
     
     # Check for single quotes
-    if "'" in json_string and not '"' in json_string:
-        line_num = json_string[:json_string.index("'")].count('\n') + 1
+    quote = json_string.find("'")
+    if quote != -1 and '"' not in json_string:
+        line_num = json_string.count('\n', 0, quote) + 1
         return f"Single quotes are not valid in JSON at line {line_num}"
     
     # Check for trailing commas (simple heuristic)
-    stripped = json_string.strip()
     if stripped.endswith(',}') or stripped.endswith(',]'):
-        lines = json_string.split('\n')
-        for i, line in enumerate(lines):
-            if line.strip().endswith(',}') or line.strip().endswith(',]'):
-                return f"Trailing comma detected at line {i + 1}"
+        match = _TRAILING_COMMA_RE.search(json_string)
+        if match is not None:
+            line_num = json_string.count('\n', 0, match.start()) + 1
+            return f"Trailing comma detected at line {line_num}"
     
     # Check for incomplete JSON
     if stripped in ('{', '[', '"{', '"['):
@@ -88,32 +174,61 @@ def _check_common_errors(json_string: str) -> Optional[str]:
     return None
 
 
-def validate_json(json_string: str, strict: bool = False) -> Union[bool, str]:
+def validate_json(
+    json_string: Union[str, bytes],
+    strict: bool = False
+) -> ValidationResult:
     """
     Validate a JSON string.
     
+    UTF-8 bytes are accepted too, like ``json.loads`` accepts them, and a
+    leading BOM is skipped.  Valid bytes are checked in place without
+    being decoded, so bytes already in hand need not be turned into a str.
+    
     Args:
-        json_string: The JSON string to validate
+        json_string: The JSON string, or UTF-8 bytes, to validate
         strict: If True, performs additional strict validation
         
     Returns:
         True if valid, error message string if invalid
     """
+    if not isinstance(json_string, str):
+        try:
+            if strict:
+                json_string = str(json_string, 'utf-8-sig')
+            else:
+                text = _accept_or_decode_utf8(json_string)
+                if text is None:
+                    return True
+                json_string = text
+        except UnicodeDecodeError as e:
+            return f"Encoding error: {str(e)}"
+    
+    if len(json_string) <= _MEMO_MAX_LENGTH:
+        return _validate_json_cached(json_string, strict)
+    return _validate_json(json_string, strict)
+
+
+def _validate_json(json_string: str, strict: bool) -> ValidationResult:
+    """Validate a JSON string; see ``validate_json``."""
+    # None of the common errors below can occur in a document simdjson
+    # accepts, so valid input returns here without scanning for them
+    if not strict and _simdjson_accepts(json_string):
+        return True
+    
     # Check for common errors first
     common_error = _check_common_errors(json_string)
     if common_error:
         return common_error
     
     try:
-        # Attempt to parse the JSON
-        parsed = json.loads(json_string)
-        
-        # Additional strict mode checks
         if strict:
-            # Check for duplicate keys (requires custom parser)
-            # For now, just check if it's mentioned in the JSON
-            if json_string.count('":') > len(set(k for k in parsed.keys())) if isinstance(parsed, dict) else 0:
-                return "Possible duplicate keys detected"
+            # Duplicate keys are only visible while parsing, so strict mode
+            # checks every object's pairs with the stdlib parser
+            json.loads(json_string, object_pairs_hook=_reject_duplicate_keys)
+        else:
+            # Only validity is needed here, not exact values
+            _fast_loads(json_string, exact=False)
         
         return True
         
@@ -121,28 +236,91 @@ def validate_json(json_string: str, strict: bool = False) -> Union[bool, str]:
         line, column = _get_line_and_column(json_string, e.pos)
         
         # Enhance error messages
-        error_msg = str(e.msg).lower()
+        kind = _decode_error_kind(e.msg)
         
-        if "expecting" in error_msg and "delimiter" in error_msg:
+        if kind == 'delimiter':
             return f"Missing comma or delimiter at line {line}, column {column}"
-        elif "invalid" in error_msg and ("escape" in error_msg or "\\x" in str(e)):
+        elif kind == 'escape':
             return f"Invalid escape sequence at line {line}, column {column}"
-        elif "expecting value" in error_msg:
+        elif kind == 'value':
             if json_string.strip() == '':
                 return "Empty input - no JSON data found"
             return f"Invalid value at line {line}, column {column}"
-        elif "extra data" in error_msg:
+        elif kind == 'extra':
             return f"Extra data after JSON at line {line}, column {column}"
         else:
             return f"JSON syntax error at line {line}, column {column}: {e.msg}"
     
+    except _DuplicateKeyError as e:
+        return f"Duplicate key '{e.key}' detected"
     except ValueError as e:
         return f"Value error: {str(e)}"
     except Exception as e:
         return f"Validation error: {str(e)}"
 
 
-def validate_json_file(filepath: str, encoding: str = 'utf-8') -> Union[bool, str]:
+# Results for short strings are memoized; the cache holds the strings
+# themselves, so long documents are always validated afresh
+_MEMO_MAX_LENGTH = 4096
+_validate_json_cached = lru_cache(maxsize=1024)(_validate_json)
+
+
+def validate_json_bytes(
+    data: Union[bytes, mmap.mmap],
+    name: str = '<memory>',
+    encoding: str = 'utf-8'
+) -> ValidationResult:
+    """
+    Validate JSON held in memory as raw bytes, as read from a file.
+    
+    Args:
+        data: The encoded JSON document, optionally starting with a UTF-8 BOM
+        name: Name used to prefix error messages (default: <memory>)
+        encoding: Encoding of ``data`` (default: utf-8)
+        
+    Returns:
+        True if valid, error message string if invalid
+    """
+    return _validate_bytes(data, name, name, encoding)
+
+
+def _validate_bytes(
+    data: Union[bytes, mmap.mmap],
+    name: str,
+    path: str,
+    encoding: str
+) -> ValidationResult:
+    """
+    Validate raw bytes; see ``validate_json_bytes``.
+    
+    Errors in the content are prefixed with ``name``, while encoding errors
+    give ``path``, so files of the same name in different directories can
+    be told apart.
+    """
+    try:
+        if codecs.lookup(encoding).name == 'utf-8':
+            json_string = _accept_or_decode_utf8(data)
+            if json_string is None:
+                return True
+        else:
+            # Handle UTF-8 BOM
+            if data[:3] == b'\xef\xbb\xbf':
+                data = data[3:]
+            json_string = str(data, encoding)
+    except UnicodeDecodeError as e:
+        return f"Encoding error in {path}: {str(e)}"
+    
+    # Validate the content
+    result = validate_json(json_string)
+    
+    # If invalid, prepend the name to the error
+    if result is not True:
+        return f"{name}: {result}"
+    
+    return True
+
+
+def validate_json_file(filepath: str, encoding: str = 'utf-8') -> ValidationResult:
     """
     Validate a JSON file.
     
@@ -153,51 +331,258 @@ def validate_json_file(filepath: str, encoding: str = 'utf-8') -> Union[bool, st
     Returns:
         True if valid, error message string if invalid
     """
-    # Check if file exists
-    if not os.path.exists(filepath):
+    try:
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    except FileNotFoundError:
         return f"File not found: {filepath}"
+    except IOError as e:
+        return f"Error reading {filepath}: {str(e)}"
     
     try:
-        with open(filepath, 'rb') as f:
-            # Read raw bytes to handle BOM
-            raw_data = f.read()
-            
-            # Handle UTF-8 BOM
-            if raw_data.startswith(b'\xef\xbb\xbf'):
-                raw_data = raw_data[3:]
-            
-            # Decode to string
-            json_string = raw_data.decode(encoding)
-        
-        # Validate the content
-        result = validate_json(json_string)
-        
-        # If invalid, prepend filename to error
-        if result is not True:
-            filename = os.path.basename(filepath)
-            return f"{filename}: {result}"
-        
-        return True
+        filename = os.path.basename(filepath)
+        st = os.fstat(fd)
+        size = st.st_size if stat.S_ISREG(st.st_mode) else 0
+        if size <= SMALL_FILE_SIZE:
+            # Pipes and /proc files report no size and cannot be mapped
+            try:
+                data = _read_fd(fd, size)
+            finally:
+                os.close(fd)
+            return _validate_bytes(data, filename, filepath, encoding)
         
-    except UnicodeDecodeError as e:
-        return f"Encoding error in {filepath}: {str(e)}"
+        with open(fd, 'rb') as f:
+            # Without simdjson, valid files too large for it are accepted
+            # from a stream; all others take the path below, which also
+            # produces the detailed error messages
+            if (
+                size > STREAM_MIN_SIZE
+                and (simdjson is None or size > SIMDJSON_MAX_SIZE)
+                and codecs.lookup(encoding).name == 'utf-8'
+            ):
+                if validate_json_stream(f) is True:
+                    return True
+                f.seek(0)
+            
+            # Validated from a memory map, so the content is never copied
+            # into bytes before being parsed or decoded
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _validate_bytes(mm, filename, filepath, encoding)
     except IOError as e:
         return f"Error reading {filepath}: {str(e)}"
     except Exception as e:
         return f"Error validating {filepath}: {str(e)}"
 
 
-def get_validation_errors(json_string: str) -> List[ValidationError]:
+def _read_fd(fd: int, size: int) -> bytes:
     """
-    Get detailed validation errors for a JSON string.
+    Read a file descriptor to the end.
+    
+    A regular file of ``size`` bytes is read with a single read(); a short
+    read, or a ``size`` of 0 for files that report none, keeps reading in
+    chunks until end of file.
+    """
+    chunks = []
+    if size:
+        chunk = os.read(fd, size)
+        if len(chunk) == size:
+            return chunk
+        chunks.append(chunk)
+    while True:
+        chunk = os.read(fd, 64 * 1024)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+class _VerticalWhitespaceScan:
+    """
+    Binary file wrapper that notes where the first vertical tab or form
+    feed read from it lies.
+    
+    yajl, behind ijson, skips both as whitespace, but JSON allows neither
+    outside strings nor any raw control character inside them, so a
+    document holding one is invalid whatever the parser reports.
+    """
+    
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        self._offset = 0
+        self.found: Optional[int] = None
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._fp.read(size)
+        if self.found is None and (b'\x0b' in data or b'\x0c' in data):
+            self.found = self._offset + min(
+                pos for pos in (data.find(b'\x0b'), data.find(b'\x0c')) if pos != -1
+            )
+        self._offset += len(data)
+        return data
+
+
+def validate_json_stream(fp: BinaryIO, chunk_size: int = 64 * 1024) -> ValidationResult:
+    """
+    Validate UTF-8 JSON read incrementally from a binary file object.
+    
+    With ijson installed the document is parsed as a stream of events and
+    never held in memory, so memory use depends on nesting depth only.
+    ijson follows the JSON grammar strictly: ``NaN``, ``Infinity`` and a
+    leading BOM, which ``validate_json_file`` accepts, are errors here, and
+    so are the vertical tabs and form feeds yajl would skip as whitespace.
+    Without ijson the stream is read whole and validated in memory.
     
     Args:
-        json_string: The JSON string to validate
+        fp: Binary file object positioned at the start of the document
+        chunk_size: Number of bytes read at a time (default: 64 KiB)
         
     Returns:
-        List of ValidationError objects (empty if valid)
+        True if valid, error message string if invalid
     """
-    errors = []
+    try:
+        # Only needed for large documents, so not imported with the module
+        import ijson
+    except ImportError:  # pragma: no cover - optional speedup
+        return validate_json_bytes(fp.read())
+    
+    source = _VerticalWhitespaceScan(fp)
+    try:
+        for _ in ijson.basic_parse(source, buf_size=chunk_size):
+            pass
+    except ijson.JSONError as e:
+        message = e.args[0] if e.args else ''
+        if isinstance(message, bytes):
+            message = message.decode('utf-8', 'replace')
+        # yajl appends a picture of the error position on further lines
+        return f"Invalid JSON: {message.strip().partition(chr(10))[0]}"
+    except UnicodeDecodeError as e:
+        # Strings are decoded as they are read, so e.g. encoded surrogates
+        # surface here rather than as a parse error
+        return f"Encoding error: {str(e)}"
+    if source.found is not None:
+        return f"Invalid JSON: invalid whitespace character at byte {source.found}"
+    return True
+
+
+def _simdjson_accepts(data: Union[str, bytes, memoryview, mmap.mmap]) -> bool:
+    """
+    Check whether ``data`` is valid JSON with simdjson's validating parser.
+    
+    simdjson builds its own tape instead of Python objects, so valid input
+    is accepted several times faster than by any ``loads``.  It is stricter
+    than the stdlib (no ``NaN``, ``1e999``, big integers or lone surrogates)
+    but skips a leading BOM, so False only means undecided: callers fall
+    back to a full parse.
+    """
+    # json.loads rejects a BOM that simdjson would skip
+    if simdjson is None or data[:1] == '\ufeff' or data[:3] == b'\xef\xbb\xbf':
+        return False
+    if isinstance(data, str) and not data.isascii():
+        # An ASCII str is read in place, but parsing any other str caches a
+        # UTF-8 copy on it for the string's lifetime; encoding it here makes
+        # that copy temporary
+        try:
+            data = data.encode('utf-8')
+        except UnicodeEncodeError:
+            # Lone surrogates, which only the stdlib accepts
+            return False
+    if len(data) <= _SHARED_PARSER_MAX_SIZE:
+        # A parser is not safe to share between threads
+        parser = getattr(_thread_state, 'parser', None)
+        if parser is None:
+            parser = _thread_state.parser = simdjson.Parser()
+    else:
+        parser = simdjson.Parser()
+    try:
+        # The document proxy is dropped at once, so the parser can be reused
+        # A memory map is read through the buffer protocol like bytes
+        parser.parse(data)  # type: ignore[arg-type]
+    except (ValueError, RuntimeError):
+        # RuntimeError covers integers beyond 64 bits
+        return False
+    return True
+
+
+def _accept_or_decode_utf8(data: Union[bytes, mmap.mmap]) -> Optional[str]:
+    """
+    Accept valid UTF-8 JSON in place, or decode it for a full parse.
+    
+    Returns:
+        None if ``data`` is valid JSON, otherwise the decoded text without
+        its BOM; raises UnicodeDecodeError if ``data`` is not UTF-8
+    """
+    # Valid UTF-8 is accepted straight from the buffer, so it is never
+    # decoded into a str
+    start = 3 if data[:3] == b'\xef\xbb\xbf' else 0
+    # The view must be released before a memory map can be closed
+    with memoryview(data)[start:] as view:
+        if _utf8_accepts(view):
+            return None
+    # The utf-8-sig decoder drops a BOM without slicing the bytes
+    return str(data, 'utf-8-sig')
+
+
+def _utf8_accepts(data: memoryview) -> bool:
+    """Check whether UTF-8 bytes without a BOM parse with simdjson or orjson."""
+    if _simdjson_accepts(data):
+        return True
+    if orjson is not None:
+        try:
+            orjson.loads(data)
+            return True
+        except orjson.JSONDecodeError:
+            pass
+    # Decode and re-validate for the detailed error message
+    return False
+
+
+def validate_json_files(
+    filepaths: List[str],
+    workers: Optional[int] = None,
+    encoding: str = 'utf-8'
+) -> Dict[str, ValidationResult]:
+    """
+    Validate many JSON files, in parallel for larger batches.
+    
+    Args:
+        filepaths: Paths to the JSON files
+        workers: Number of worker processes (default: one per CPU)
+        encoding: File encoding (default: utf-8)
+        
+    Returns:
+        Mapping of each path to True if valid, or its error message
+    """
+    if len(filepaths) < 10:
+        # Pool start-up costs more than it saves on small batches
+        return {path: validate_json_file(path, encoding) for path in filepaths}
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(filepaths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            validate_json_file,
+            filepaths,
+            repeat(encoding),
+            chunksize=chunksize
+        )
+        return dict(zip(filepaths, results))
+
+
+def _parse_once(json_string: str) -> Tuple[bool, List[ValidationError]]:
+    """
+    Parse a JSON string a single time, collecting error details on failure.
+    
+    The parsers are those ``validate_json`` falls back to, so both give
+    the same verdict, and the error of the one failed parse is kept.
+    
+    Args:
+        json_string: The JSON string to parse
+        
+    Returns:
+        ``(True, [])`` if valid, otherwise ``(False, errors)`` with a list
+        of ValidationError objects
+    """
+    errors: List[ValidationError] = []
     
     # Check for common errors
     common_error = _check_common_errors(json_string)
@@ -215,36 +600,28 @@ def get_validation_errors(json_string: str) -> List[ValidationError]:
             line=line,
             column=0
         ))
-        return errors
+        return False, errors
     
     try:
-        json.loads(json_string)
-        return []  # Valid JSON, no errors
+        # Only validity is needed here, not exact values
+        _fast_loads(json_string, exact=False)
+        return True, errors
         
     except json.JSONDecodeError as e:
         line, column = _get_line_and_column(json_string, e.pos)
         
-        # Extract context around error
-        lines = json_string.split('\n')
-        if 0 <= line - 1 < len(lines):
-            error_line = lines[line - 1]
-            start = max(0, column - 20)
-            end = min(len(error_line), column + 20)
-            context = error_line[start:end].strip()
-        else:
-            context = None
+        # Extract context around error, slicing only the window itself so a
+        # long minified line is never copied or split
+        line_start = e.pos - column + 1
+        line_end = json_string.find('\n', e.pos)
+        if line_end == -1:
+            line_end = len(json_string)
+        start = line_start + max(0, column - 20)
+        end = min(line_end, line_start + column + 20)
+        context = json_string[start:end].strip()
         
         # Create detailed error message
-        if "expecting" in e.msg.lower() and "delimiter" in e.msg.lower():
-            message = "Missing comma between elements"
-        elif "invalid" in e.msg.lower() and "escape" in e.msg.lower():
-            message = "Invalid escape sequence in string"
-        elif "expecting value" in e.msg.lower():
-            message = "Expected a value but found invalid token"
-        elif "extra data" in e.msg.lower():
-            message = "Extra data after valid JSON"
-        else:
-            message = e.msg
+        message = _DETAILED_MESSAGES.get(_decode_error_kind(e.msg), e.msg)
         
         errors.append(ValidationError(
             message=message,
@@ -260,4 +637,18 @@ def get_validation_errors(json_string: str) -> List[ValidationError]:
             column=None
         ))
     
-    return errors
\ No newline at end of file
+    return False, errors
+
+
+def get_validation_errors(json_string: str) -> List[ValidationError]:
+    """
+    Get detailed validation errors for a JSON string.
+    
+    Args:
+        json_string: The JSON string to validate
+        
+    Returns:
+        List of ValidationError objects (empty if valid)
+    """
+    _, errors = _parse_once(json_string)
+    return errors
@@ -0,0 +1,17 @@
+"""Assertion helpers shared by the test modules."""
+
+import re
+
+
+def assert_order(text, *keys):
+    """Assert that the JSON keys first appear in ``text`` in the given order.
+    
+    All quoted keys are located in one regex pass over the text.
+    """
+    pattern = re.compile('|'.join(f'"{re.escape(key)}"' for key in keys))
+    seen = []
+    for match in pattern.finditer(text):
+        key = match.group()[1:-1]
+        if key not in seen:
+            seen.append(key)
+    assert seen == list(keys), f"Keys appear in order {seen}, expected {list(keys)}"
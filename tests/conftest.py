@@ -0,0 +1,18 @@
+"""Fixtures shared by the test modules."""
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CLI runner shared by every test in the session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def large_json_bytes():
+    """Build a 10,000-item JSON document once for the whole session."""
+    # Templated directly: the output is fixed, so there is nothing to serialize
+    items = b",".join(b'{"id":%d}' % i for i in range(10000))
+    return b'{"items":[' + items + b']}'
@@ -6,19 +6,17 @@ All tests should FAIL initially until implementation is complete.
 
 import json
 import os
+import re
 from pathlib import Path
 
 import pytest
-from click.testing import CliRunner
 
 # This import will fail initially - that's expected in TDD
 from json_prettify.cli import main
+from tests._asserts import assert_order
 
-
-@pytest.fixture
-def runner():
-    """Create a CLI runner for testing."""
-    return CliRunner()
+_DIGIT_RE = re.compile(r"\d")
+_LOCATION_HINT_RE = re.compile(r"line|column|position", re.IGNORECASE)
 
 
 @pytest.fixture
@@ -37,12 +35,19 @@ def invalid_json_file(tmp_path):
     return json_file
 
 
+# Serialized once at import rather than per test that writes it.  Every file
+# under the 1 MiB progress threshold takes the same read path, so a few
+# kilobytes exercise it as well as a hundred
+_LARGE_JSON = json.dumps(
+    {"items": [{"id": i, "data": "x" * 100} for i in range(64)]}
+).encode("utf-8")
+
+
 @pytest.fixture
 def large_json_file(tmp_path):
     """Create a large JSON file for testing streaming."""
     json_file = tmp_path / "large.json"
-    data = {"items": [{"id": i, "data": "x" * 100} for i in range(1000)]}
-    json_file.write_text(json.dumps(data))
+    json_file.write_bytes(_LARGE_JSON)
     return json_file
 
 
@@ -56,7 +61,7 @@ class TestCLIBasicOptions:
         assert "json-prettify" in result.output.lower()
         assert "version" in result.output.lower()
         # Should show semantic version like 1.0.0
-        assert any(char.isdigit() for char in result.output)
+        assert _DIGIT_RE.search(result.output)
 
     def test_help_option(self, runner):
         """Test --help flag shows comprehensive help."""
@@ -109,6 +114,47 @@ class TestCLIFileInput:
         # Should indicate which file is which
         assert "file1.json" in result.output or "---" in result.output
 
+    def test_prettify_multiple_files_parallel(self, runner, tmp_path):
+        """Test that --jobs keeps output in input order."""
+        files = []
+        for i in range(4):
+            json_file = tmp_path / f"file{i}.json"
+            json_file.write_text(f'{{"file": {i}}}')
+            files.append(str(json_file))
+        invalid_file = tmp_path / "invalid.json"
+        invalid_file.write_text('{"file": }')
+        files.append(str(invalid_file))
+
+        result = runner.invoke(main, ["--jobs", "2", "--no-color"] + files)
+        assert result.exit_code == 1
+        positions = [result.output.index(f'"file": {i}') for i in range(4)]
+        assert positions == sorted(positions)
+        assert "--- file3.json ---" in result.output
+        assert "Error" in result.output
+
+        output_file = tmp_path / "combined.json"
+        result = runner.invoke(main, ["--jobs", "2", "--output", str(output_file)] + files[:4])
+        assert result.exit_code == 0
+        assert output_file.read_text() == "\n\n".join(f'{{\n  "file": {i}\n}}' for i in range(4))
+
+    def test_parallel_worker_failure_is_a_file_error(self, runner, tmp_path, monkeypatch):
+        """Test that a task failing in the pool is reported per file, not raised."""
+        from json_prettify import cli
+
+        files = []
+        for i in range(2):
+            json_file = tmp_path / f"file{i}.json"
+            json_file.write_text(f'{{"file": {i}}}')
+            files.append(str(json_file))
+        # A lambda cannot be pickled, so every task fails before it runs
+        monkeypatch.setattr(cli, "process_file_captured", lambda *args: None)
+
+        result = runner.invoke(main, ["--jobs", "2", "--no-color"] + files)
+        assert result.exit_code == 1
+        assert result.exception is None or isinstance(result.exception, SystemExit)
+        assert "--- file1.json ---" in result.output
+        assert result.output.count("Error: ") == 2
+
     def test_file_not_found_error(self, runner):
         """Test error handling for non-existent file."""
         result = runner.invoke(main, ["/path/to/nonexistent.json"])
@@ -117,6 +163,7 @@ class TestCLIFileInput:
         assert "not found" in result.output.lower() or "does not exist" in result.output.lower()
         assert "nonexistent.json" in result.output
 
+    @pytest.mark.slow
     def test_permission_denied_error(self, runner, tmp_path):
         """Test error handling for permission denied."""
         protected_file = tmp_path / "protected.json"
@@ -167,41 +214,34 @@ class TestCLIStdinInput:
         assert "Error" in result.output
         assert "empty" in result.output.lower() or "no input" in result.output.lower()
 
+    def test_stdin_encoding(self, runner):
+        """Test that stdin is decoded with --encoding."""
+        input_json = '{"text": "café"}'.encode('latin-1')
+        result = runner.invoke(main, ["--compact", "--encoding", "latin-1"], input=input_json)
+        assert result.exit_code == 0
+        assert "café" in result.output
+
+        result = runner.invoke(main, ["--encoding", "ascii"], input=input_json)
+        assert result.exit_code == 1
+        assert "encoding" in result.output.lower()
+
 
 class TestCLIFormattingOptions:
     """Test CLI formatting options."""
 
-    def test_indent_option_with_2_spaces(self, runner):
-        """Test --indent 2 option."""
-        input_json = '{"level1":{"level2":"value"}}'
-        result = runner.invoke(main, ["--indent", "2"], input=input_json)
-        assert result.exit_code == 0
-        
-        lines = result.output.split('\n')
-        # Check 2-space indentation
-        assert any(line.startswith('  "level1"') for line in lines)
-        assert any(line.startswith('    "level2"') for line in lines)
-
-    def test_indent_option_with_4_spaces(self, runner):
-        """Test --indent 4 option."""
+    @pytest.mark.parametrize(
+        "indent,prefix", [("2", "  "), ("4", "    "), ("tab", "\t")], ids=["2", "4", "tab"]
+    )
+    def test_indent_option(self, runner, indent, prefix):
+        """Test --indent with spaces and tabs."""
         input_json = '{"level1":{"level2":"value"}}'
-        result = runner.invoke(main, ["--indent", "4"], input=input_json)
+        result = runner.invoke(main, ["--indent", indent], input=input_json)
         assert result.exit_code == 0
         
         lines = result.output.split('\n')
-        # Check 4-space indentation
-        assert any(line.startswith('    "level1"') for line in lines)
-        assert any(line.startswith('        "level2"') for line in lines)
-
-    def test_indent_option_with_tab(self, runner):
-        """Test --indent tab option."""
-        input_json = '{"level1":{"level2":"value"}}'
-        result = runner.invoke(main, ["--indent", "tab"], input=input_json)
-        assert result.exit_code == 0
-        
-        # Should use tab characters
-        assert '\t"level1"' in result.output
-        assert '\t\t"level2"' in result.output
+        # Check one indent unit per nesting level
+        assert any(line.startswith(prefix + '"level1"') for line in lines)
+        assert any(line.startswith(prefix * 2 + '"level2"') for line in lines)
 
     def test_sort_keys_option(self, runner):
         """Test --sort-keys option."""
@@ -211,9 +251,7 @@ class TestCLIFormattingOptions:
         
         # Keys should appear in alphabetical order
         output = result.output
-        assert output.index('"apple"') < output.index('"banana"')
-        assert output.index('"banana"') < output.index('"middle"')
-        assert output.index('"middle"') < output.index('"zebra"')
+        assert_order(output, "apple", "banana", "middle", "zebra")
 
     def test_compact_option(self, runner):
         """Test --compact option for minified output."""
@@ -225,6 +263,26 @@ class TestCLIFormattingOptions:
         assert result.output.strip() == '{"formatted":true,"spaces":"everywhere"}'
         assert '\n' not in result.output.strip()
 
+    def test_ensure_ascii_option(self, runner):
+        """Test --ensure-ascii escapes non-ASCII characters."""
+        input_json = '{"text": "café"}'
+        result = runner.invoke(main, ["--compact"], input=input_json)
+        assert result.output.strip() == '{"text":"café"}'
+
+        result = runner.invoke(main, ["--compact", "--ensure-ascii"], input=input_json)
+        assert result.exit_code == 0
+        assert result.output.strip() == '{"text":"caf\\u00e9"}'
+
+    def test_normalize_option(self, runner):
+        """Test --normalize applies Unicode normalization to the input."""
+        input_json = '{"text": "cafe\u0301"}'
+        result = runner.invoke(main, ["--compact"], input=input_json)
+        assert result.output.strip() == '{"text":"cafe\u0301"}'
+
+        result = runner.invoke(main, ["--compact", "--normalize", "nfc"], input=input_json)
+        assert result.exit_code == 0
+        assert result.output.strip() == '{"text":"caf\u00e9"}'
+
     def test_no_color_option(self, runner):
         """Test --no-color option disables ANSI colors."""
         input_json = '{"test": true, "error": null}'
@@ -277,6 +335,28 @@ class TestCLIValidationOption:
         assert result.exit_code == 1
         assert "Error" in result.output
 
+    def test_validate_only_large_file(self, runner, tmp_path):
+        """Test --validate-only on files large enough to be streamed."""
+        items = ",".join(f'{{"id": {i}, "data": "{"x" * 100}"}}' for i in range(20000))
+        valid_file = tmp_path / "large.json"
+        valid_file.write_text(f'{{"items": [{items}]}}')
+        result = runner.invoke(main, ["--validate-only", "--no-color", str(valid_file)])
+        assert result.exit_code == 0
+        assert "OK" in result.output
+
+        invalid_file = tmp_path / "large_invalid.json"
+        invalid_file.write_text(f'{{"items": [{items},]}}')
+        result = runner.invoke(main, ["--validate-only", "--no-color", str(invalid_file)])
+        assert result.exit_code == 1
+        assert "line 1" in result.output
+
+        # yajl would skip a form feed or vertical tab as whitespace
+        for byte in ("\x0b", "\x0c"):
+            invalid_file.write_text(f'{{"items":{byte}[{items}]}}')
+            result = runner.invoke(main, ["--validate-only", "--no-color", str(invalid_file)])
+            assert result.exit_code == 1
+            assert "Invalid JSON" in result.output
+
 
 class TestCLIOutputOption:
     """Test CLI output file option."""
@@ -316,6 +396,59 @@ class TestCLIOutputOption:
         assert '"new": "content"' in content
         assert '"old"' not in content
 
+    def test_output_streams_large_file(self, runner, tmp_path, monkeypatch):
+        """Test that a large file written to --output is formatted as a stream."""
+        from json_prettify import cli, formatter
+
+        pytest.importorskip("ijson")
+        input_file = tmp_path / "large.json"
+        input_file.write_bytes(_LARGE_JSON)
+        output_file = tmp_path / "output.json"
+
+        monkeypatch.setattr(formatter, "STREAM_MIN_SIZE", 0)
+        monkeypatch.setattr(cli, "read_file_with_progress", None)
+        result = runner.invoke(main, [str(input_file), "--output", str(output_file), "--indent", "4"])
+        assert result.exit_code == 0
+        assert output_file.read_text() == json.dumps(json.loads(_LARGE_JSON), indent=4, ensure_ascii=False)
+
+    @pytest.mark.parametrize("content,message", [
+        (b'{"a":\x0c1}', "Invalid JSON"),
+        (b'{"a": "\xed\xa0\x80"}', "Encoding error in"),
+    ])
+    def test_output_large_file_reports_errors(self, runner, tmp_path, monkeypatch, content, message):
+        """Test that streaming a large file to --output reports errors like the regular path."""
+        from json_prettify import formatter
+
+        pytest.importorskip("ijson")
+        input_file = tmp_path / "large.json"
+        input_file.write_bytes(content)
+        output_file = tmp_path / "output.json"
+
+        monkeypatch.setattr(formatter, "STREAM_MIN_SIZE", 0)
+        result = runner.invoke(main, [str(input_file), "--output", str(output_file)])
+        assert result.exit_code == 1
+        assert message in result.output
+        assert not output_file.exists()
+
+    def test_output_large_file_writes_through_symlink(self, runner, tmp_path, monkeypatch):
+        """Test that streaming to a symlinked --output replaces the file it points to."""
+        from json_prettify import cli, formatter
+
+        pytest.importorskip("ijson")
+        input_file = tmp_path / "large.json"
+        input_file.write_bytes(_LARGE_JSON)
+        target = tmp_path / "target.json"
+        target.write_text("{}")
+        link = tmp_path / "link.json"
+        link.symlink_to(target)
+
+        monkeypatch.setattr(formatter, "STREAM_MIN_SIZE", 0)
+        monkeypatch.setattr(cli, "read_file_with_progress", None)
+        result = runner.invoke(main, [str(input_file), "--output", str(link)])
+        assert result.exit_code == 0
+        assert link.is_symlink()
+        assert target.read_text() == json.dumps(json.loads(_LARGE_JSON), indent=2, ensure_ascii=False)
+
     def test_output_creates_directories(self, runner, tmp_path):
         """Test --output creates parent directories if needed."""
         output_file = tmp_path / "new" / "dir" / "output.json"
@@ -333,23 +466,15 @@ class TestCLIOutputOption:
 class TestCLIEncodingOption:
     """Test CLI encoding option."""
 
-    def test_encoding_utf8(self, runner, tmp_path):
-        """Test --encoding utf-8 (default)."""
-        json_file = tmp_path / "utf8.json"
-        json_file.write_text('{"text": "Hello 世界"}', encoding='utf-8')
-        
-        result = runner.invoke(main, [str(json_file), "--encoding", "utf-8"])
-        assert result.exit_code == 0
-        assert "世界" in result.output
-
-    def test_encoding_latin1(self, runner, tmp_path):
-        """Test --encoding latin-1."""
-        json_file = tmp_path / "latin1.json"
-        json_file.write_text('{"text": "café"}', encoding='latin-1')
+    @pytest.mark.parametrize("encoding,text", [("utf-8", "Hello 世界"), ("latin-1", "café")])
+    def test_encoding(self, runner, tmp_path, encoding, text):
+        """Test --encoding utf-8 (default) and latin-1."""
+        json_file = tmp_path / "encoded.json"
+        json_file.write_text('{"text": "%s"}' % text, encoding=encoding)
         
-        result = runner.invoke(main, [str(json_file), "--encoding", "latin-1"])
+        result = runner.invoke(main, [str(json_file), "--encoding", encoding])
         assert result.exit_code == 0
-        assert "café" in result.output
+        assert text in result.output
 
     def test_encoding_error(self, runner, tmp_path):
         """Test encoding error handling."""
@@ -367,23 +492,21 @@ class TestCLIEncodingOption:
 class TestCLIErrorHandling:
     """Test CLI error handling and messages."""
 
-    def test_invalid_json_shows_details(self, runner):
+    @pytest.mark.parametrize("invalid_json,expected_hint", [
+        ('{"missing": "quote}', "quote"),
+        ('{"trailing": "comma",}', "comma"),
+        ("{'single': 'quotes'}", "quote"),
+        ('{"incomplete": ', "incomplete"),
+        ('{]', "bracket"),
+    ])
+    def test_invalid_json_shows_details(self, runner, invalid_json, expected_hint):
         """Test that invalid JSON errors show helpful details."""
-        test_cases = [
-            ('{"missing": "quote}', "quote"),
-            ('{"trailing": "comma",}', "comma"),
-            ("{'single': 'quotes'}", "quote"),
-            ('{"incomplete": ', "incomplete"),
-            ('{]', "bracket")
-        ]
-        
-        for invalid_json, expected_hint in test_cases:
-            result = runner.invoke(main, input=invalid_json)
-            assert result.exit_code == 1
-            assert "Error" in result.output
-            assert "JSON" in result.output
-            # Should give hints about the error
-            assert any(hint in result.output.lower() for hint in [expected_hint, "line", "column", "position"])
+        result = runner.invoke(main, input=invalid_json)
+        assert result.exit_code == 1
+        assert "Error" in result.output
+        assert "JSON" in result.output
+        # Should give hints about the error
+        assert expected_hint in result.output.lower() or _LOCATION_HINT_RE.search(result.output)
 
     def test_large_file_handling(self, runner, large_json_file):
         """Test handling of large JSON files."""
@@ -391,6 +514,20 @@ class TestCLIErrorHandling:
         assert result.exit_code == 0
         # Should complete without memory errors
 
+    def test_large_file_memory_mapped(self, runner, tmp_path):
+        """Test that files over 1MB read through a memory map decode the same."""
+        large_file = tmp_path / "large.json"
+        large_file.write_text(json.dumps({"text": "café " * 300000}), encoding="utf-8")
+        result = runner.invoke(main, [str(large_file), "--compact", "--no-color"])
+        assert result.exit_code == 0
+        expected = json.dumps({"text": "café " * 300000}, ensure_ascii=False, separators=(",", ":"))
+        assert result.output.strip() == expected
+
+        large_file.write_bytes(b'{"data": "' + b"x" * 2 * 1024 * 1024 + b'\x00"}')
+        result = runner.invoke(main, [str(large_file), "--no-color"])
+        assert result.exit_code == 1
+        assert "Binary data detected" in result.output
+
     def test_binary_file_rejection(self, runner, tmp_path):
         """Test that binary files are rejected."""
         binary_file = tmp_path / "binary.json"
@@ -420,8 +557,8 @@ class TestCLICombinedOptions:
         
         content = output_file.read_text()
         # Check sorting at all levels
-        assert content.index('"a"') < content.index('"m"') < content.index('"z"')
-        assert content.index('"b"') < content.index('"y"')
+        assert_order(content, "a", "m", "z")
+        assert_order(content, "b", "y")
         # Check 4-space indent
         assert '    "a"' in content
 
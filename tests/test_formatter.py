@@ -9,7 +9,35 @@ import pytest
 from pathlib import Path
 
 # These imports will fail initially - that's expected in TDD
-from json_prettify.formatter import format_json, format_json_stream
+from json_prettify.formatter import format_json, format_json_bytes, format_json_stream
+from tests._asserts import assert_order
+
+
+@pytest.fixture(params=[(), ("rapidjson",), ("orjson",), ("orjson", "rapidjson")], ids=str)
+def without_backends(request, monkeypatch):
+    """Run a test with each combination of accelerated backends hidden."""
+    from json_prettify import formatter
+
+    for name in request.param:
+        monkeypatch.setattr(formatter, name, None)
+
+
+def assert_formats_like_stdlib(input_json, ensure_ascii=True):
+    """Assert that both formatters write ``input_json`` as json.dumps does in every layout."""
+    data = json.loads(input_json)
+    for kwargs in ({}, {"indent": 4}, {"indent": "\t"}, {"compact": True}, {"sort_keys": True}):
+        compact = kwargs.get("compact", False)
+        expected = json.dumps(
+            data,
+            indent=None if compact else kwargs.get("indent", 2),
+            separators=(",", ":") if compact else None,
+            sort_keys=kwargs.get("sort_keys", False),
+            ensure_ascii=ensure_ascii,
+        )
+        assert format_json(input_json, ensure_ascii=ensure_ascii, **kwargs) == expected
+        assert format_json_bytes(
+            input_json.encode("utf-8"), ensure_ascii=ensure_ascii, **kwargs
+        ) == expected.encode("utf-8")
 
 
 class TestFormatJson:
@@ -39,9 +67,7 @@ class TestFormatJson:
         result = format_json(input_json, sort_keys=True)
         
         # Keys should be in alphabetical order
-        assert result.index('"apple"') < result.index('"banana"')
-        assert result.index('"banana"') < result.index('"middle"')
-        assert result.index('"middle"') < result.index('"zebra"')
+        assert_order(result, "apple", "banana", "middle", "zebra")
         
     def test_format_with_compact_option(self):
         """Test formatting JSON with compact option (minified)."""
@@ -87,6 +113,79 @@ class TestFormatJson:
         # Should be compact but with space after colons
         assert '{"items": [1,2,3],"active": true}' in result.replace(' ', '')
 
+    def test_format_matches_stdlib_output(self):
+        """Test that accelerated backends produce the same text as the stdlib."""
+        input_json = (
+            '{"b":[],"a":{"x":{},"y":[1,2.5,null]},"text":"caf\\u00e9 \\"q\\"",'
+            '"big":123456789012345678901234567890}'
+        )
+        for indent in (2, 4, '\t'):
+            for sort_keys in (False, True):
+                expected = json.dumps(
+                    json.loads(input_json),
+                    indent=indent,
+                    sort_keys=sort_keys,
+                    ensure_ascii=False,
+                )
+                result = format_json(
+                    input_json, indent=indent, sort_keys=sort_keys, ensure_ascii=False
+                )
+                assert result == expected
+
+        for sort_keys in (False, True):
+            expected = json.dumps(
+                json.loads(input_json),
+                sort_keys=sort_keys,
+                ensure_ascii=False,
+                separators=(',', ':'),
+            )
+            result = format_json(
+                input_json, compact=True, sort_keys=sort_keys, ensure_ascii=False
+            )
+            assert result == expected
+
+    def test_format_reindented_output_matches_stdlib(self, monkeypatch):
+        """Test re-indenting orjson output when rapidjson is not installed."""
+        from json_prettify import formatter
+
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(formatter, "rapidjson", None)
+        input_json = '{"a":{"b":[1,{"c":"  two  spaces"}],"d":[]},"e":"x"}'
+        for indent in (0, 1, 3, 4, '\t'):
+            for sort_keys in (False, True):
+                expected = json.dumps(
+                    json.loads(input_json), indent=indent, sort_keys=sort_keys
+                )
+                assert format_json(input_json, indent=indent, sort_keys=sort_keys) == expected
+
+    def test_format_ascii_input_matches_stdlib_output(self):
+        """Test that ensure_ascii output is unchanged for ASCII input."""
+        for input_json in (
+            '{"a":[1,2.5,"x\\ny"],"b":{}}', '{"text":"caf\\u00e9"}', '{"del":"x\x7f"}'
+        ):
+            for indent in (2, 4):
+                expected = json.dumps(json.loads(input_json), indent=indent)
+                assert format_json(input_json, indent=indent) == expected
+                assert format_json_bytes(
+                    input_json.encode('utf-8'), indent=indent
+                ) == expected.encode('utf-8')
+
+    def test_format_bytes_matches_format_json(self):
+        """Test that format_json_bytes is format_json on UTF-8 bytes."""
+        input_json = '{"b":[],"text":"Hello 世界","big":123456789012345678901234567890}'
+        for kwargs in (
+            {"ensure_ascii": False},
+            {"ensure_ascii": False, "sort_keys": True},
+            {"indent": 4},
+            {"compact": True},
+        ):
+            expected = format_json(input_json, **kwargs).encode('utf-8')
+            assert format_json_bytes(input_json.encode('utf-8'), **kwargs) == expected
+
+        assert format_json_bytes(b' {} ', ensure_ascii=False) == b'{}'
+        with pytest.raises(json.JSONDecodeError):
+            format_json_bytes(b'{"invalid": json}', ensure_ascii=False)
+
 
 class TestFormatJsonStream:
     """Test cases for streaming JSON formatter (for large files)."""
@@ -108,6 +207,7 @@ class TestFormatJsonStream:
         result = json.loads(output_file.read_text())
         assert len(result["items"]) == 100
         
+    @pytest.mark.slow
     def test_stream_format_large_file(self, tmp_path):
         """Test streaming format handles large files efficiently."""
         input_file = tmp_path / "large.json"
@@ -145,8 +245,7 @@ class TestFormatJsonStream:
         format_json_stream(str(input_file), str(output_file), indent=2, sort_keys=True)
         
         result_text = output_file.read_text()
-        assert result_text.index('"a"') < result_text.index('"m"')
-        assert result_text.index('"m"') < result_text.index('"z"')
+        assert_order(result_text, "a", "m", "z")
         
     def test_stream_format_invalid_json(self, tmp_path):
         """Test streaming format handles invalid JSON gracefully."""
@@ -158,6 +257,7 @@ class TestFormatJsonStream:
         with pytest.raises(json.JSONDecodeError):
             format_json_stream(str(input_file), str(output_file))
             
+    @pytest.mark.slow
     def test_stream_format_memory_efficiency(self, tmp_path):
         """Test that streaming doesn't load entire file into memory."""
         input_file = tmp_path / "huge.json"
@@ -177,6 +277,101 @@ class TestFormatJsonStream:
         
         assert output_file.exists()
 
+    @pytest.mark.slow
+    def test_stream_format_bounded_memory(self, tmp_path, monkeypatch):
+        """Test that streamed formatting never holds the document in memory."""
+        import tracemalloc
+        from json_prettify import formatter
+
+        pytest.importorskip("ijson")
+        monkeypatch.setattr(formatter, "STREAM_MIN_SIZE", 0)
+        input_file = tmp_path / "huge.json"
+        output_file = tmp_path / "huge_formatted.json"
+        with open(input_file, 'w') as f:
+            f.write('{"items": [')
+            f.write(','.join(f'{{"id": {i}, "data": "{"x" * 100}"}}' for i in range(40000)))
+            f.write(']}')
+        size = input_file.stat().st_size
+
+        tracemalloc.start()
+        try:
+            format_json_stream(str(input_file), str(output_file), chunk_size=8192)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Parsing the whole file would allocate several times its size
+        assert peak < size // 4
+        assert json.loads(output_file.read_text())["items"][-1]["id"] == 39999
+
+    def test_stream_format_file_objects(self):
+        """Test streaming format between text and binary file objects."""
+        import io
+
+        data = '{"name":"John","text":"Hello 世界"}'
+        expected = format_json(data)
+
+        for source in (io.StringIO(data), io.BytesIO(data.encode('utf-8'))):
+            text_output = io.StringIO()
+            format_json_stream(source, text_output)
+            assert text_output.getvalue() == expected
+
+            source.seek(0)
+            binary_output = io.BytesIO()
+            format_json_stream(source, binary_output)
+            assert binary_output.getvalue() == expected.encode('utf-8')
+
+    def test_stream_format_in_place_keeps_text_after_nul(self, tmp_path):
+        """Test that a document after a NUL byte is neither ignored nor overwritten."""
+        input_file = tmp_path / "input.json"
+        input_file.write_bytes(b'{"a": 1}\x00{"b": 2}')
+        for kwargs in ({}, {"ensure_ascii": False}, {"indent": 4}, {"compact": True}):
+            with pytest.raises(json.JSONDecodeError):
+                format_json_stream(str(input_file), **kwargs)
+            with pytest.raises(json.JSONDecodeError):
+                format_json('{"a": 1}\x00{"b": 2}', **kwargs)
+        assert input_file.read_bytes() == b'{"a": 1}\x00{"b": 2}'
+
+    def test_stream_format_streamed_matches_in_memory(self, tmp_path, monkeypatch):
+        """Test that event-streamed formatting writes the in-memory output."""
+        from json_prettify import formatter
+
+        pytest.importorskip("ijson")
+        input_file = tmp_path / "input.json"
+        input_file.write_text(
+            '{"b": [], "a": {"x": {}, "y": [1, 2.5, null, true]},'
+            ' "text": "caf\\u00e9 \\"q\\"", "big": 123456789012345678901234567890}'
+        )
+        options = [
+            {}, {"indent": 4}, {"indent": "\t"}, {"ensure_ascii": False}, {"sort_keys": True}
+        ]
+        expected = [format_json(input_file.read_text(), **kwargs) for kwargs in options]
+
+        monkeypatch.setattr(formatter, "STREAM_MIN_SIZE", 0)
+        for kwargs, text in zip(options, expected):
+            output_file = tmp_path / "output.json"
+            format_json_stream(str(input_file), str(output_file), **kwargs)
+            assert output_file.read_text(encoding="utf-8") == text
+
+        # Formatting in place replaces the input only once it is complete
+        format_json_stream(str(input_file), indent=4)
+        assert input_file.read_text() == expected[1]
+
+        # Repeated keys fall back to the in-memory path, which keeps the last value
+        input_file.write_text('{"a": 1, "b": {"c": 2, "c": [3]}, "a": 4, "d": {"c": 5}}')
+        format_json_stream(str(input_file), str(output_file))
+        assert output_file.read_text(encoding="utf-8") == format_json(input_file.read_text())
+        assert '"a": 4' in output_file.read_text(encoding="utf-8")
+
+        # Errors leave the output and no temporary files behind
+        input_file.write_text('{"invalid": json}')
+        with pytest.raises(json.JSONDecodeError):
+            format_json_stream(str(input_file), str(output_file))
+        assert output_file.read_text(encoding="utf-8") == format_json(
+            '{"a": 4, "b": {"c": [3]}, "d": {"c": 5}}'
+        )
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["input.json", "output.json"]
+
 
 class TestFormatJsonEdgeCases:
     """Test edge cases for JSON formatting."""
@@ -200,6 +395,18 @@ class TestFormatJsonEdgeCases:
         with pytest.raises(ValueError):
             format_json('{"value": Infinity}')
             
+    def test_format_rejects_types_the_stdlib_rejects(self):
+        """Test that bytes and iterators raise TypeError with every layout."""
+        for kwargs in ({}, {"indent": 4}, {"indent": "\t"}, {"compact": True}):
+            for value in (b"x", bytearray(b"x"), iter([1])):
+                with pytest.raises(TypeError):
+                    format_json({"a": value}, ensure_ascii=False, **kwargs)
+            assert format_json({"a": (1, 2)}, ensure_ascii=False, **kwargs) == json.dumps(
+                {"a": [1, 2]},
+                indent=None if kwargs.get("compact") else kwargs.get("indent", 2),
+                separators=(",", ":") if kwargs.get("compact") else None,
+            )
+
     def test_format_with_circular_reference_detection(self):
         """Test that formatter detects circular references."""
         # This would need special handling in implementation
@@ -214,4 +421,39 @@ class TestFormatJsonEdgeCases:
         # Verify precision is maintained
         parsed = json.loads(result)
         assert parsed["pi"] == 3.141592653589793
-        assert parsed["large"] == 12345678901234567890
\ No newline at end of file
+        assert parsed["large"] == 12345678901234567890
+
+    @pytest.mark.usefixtures("without_backends")
+    def test_format_preserves_big_integers(self):
+        """Test integers beyond 64 bits with every combination of backends."""
+        assert_formats_like_stdlib(
+            '{"max": 18446744073709551615, "over": 18446744073709551616,'
+            ' "neg": -9223372036854775809, "big": [123456789012345678901234567890]}'
+        )
+
+    @pytest.mark.usefixtures("without_backends")
+    def test_format_keeps_overflowing_numbers_infinite(self):
+        """Test that numbers beyond the float range are written as Infinity, not null."""
+        input_json = (
+            '{"a": [1e400, -1e999, 1E+400, 18e307, 1' + "0" * 310 + '.0], "b": null}'
+        )
+        assert "-Infinity" in json.dumps(json.loads(input_json))
+        assert_formats_like_stdlib(input_json)
+
+    @pytest.mark.usefixtures("without_backends")
+    def test_format_writes_small_and_large_floats_like_stdlib(self):
+        """Test floats that orjson would write in its own notation."""
+        input_json = (
+            '{"a": [1.5e-7, 1.1e-05, 0.000011, 2e-9, -3.25E-6], '
+            '"b": [1e16, 12345678901234567.0, 1.5e+20], "c": 0.5}'
+        )
+        expected = json.dumps(json.loads(input_json))
+        assert "1.5e-07" in expected and "1e+16" in expected
+        assert_formats_like_stdlib(input_json, ensure_ascii=True)
+        assert_formats_like_stdlib(input_json, ensure_ascii=False)
+
+    @pytest.mark.usefixtures("without_backends")
+    def test_format_escapes_control_characters_like_stdlib(self):
+        """Test that control characters are escaped with lower-case hex digits."""
+        data = {"ctrl": "".join(chr(i) for i in range(32)), "text": "\\u001F \\\\\x1f é"}
+        assert_formats_like_stdlib(json.dumps(data), ensure_ascii=False)
@@ -4,22 +4,28 @@ These tests cover complex scenarios, edge cases, and real-world usage patterns.
 """
 
 import json
-import os
-import tempfile
 from pathlib import Path
 import pytest
-from click.testing import CliRunner
 
 from json_prettify.cli import main
 
 
-@pytest.fixture
-def runner():
-    """Create a CLI runner for testing."""
-    return CliRunner()
+# Input of TestEdgeCases.test_special_json_values
+_SPECIAL_VALUES_JSON = json.dumps({
+    "null_value": None,
+    "true_value": True,
+    "false_value": False,
+    "zero": 0,
+    "negative": -123,
+    "float": 3.14159,
+    "scientific": 1.23e-4,
+    "empty_string": "",
+    "escape_chars": "line1\nline2\ttab\r\nwindows",
+    "unicode_escape": "\u0048\u0065\u006c\u006c\u006f"
+})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def deeply_nested_json():
     """Create deeply nested JSON structure (5+ levels)."""
     return {
@@ -49,7 +55,7 @@ def deeply_nested_json():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def large_array_json():
     """Create JSON with large arrays (1000+ elements)."""
     return {
@@ -108,6 +114,41 @@ def unicode_json():
     }
 
 
+@pytest.fixture(scope="module")
+def large_file(tmp_path_factory):
+    """Create a large JSON file (10MB+), shared by the tests of this module."""
+    large_file = tmp_path_factory.mktemp("large") / "large.json"
+    
+    # Create a large data structure
+    data = {
+        "metadata": {
+            "version": "1.0",
+            "created": "2024-01-01",
+            "size": "large"
+        },
+        "records": []
+    }
+    
+    # Add records until file is > 10MB
+    record_template = {
+        "id": 0,
+        "name": "x" * 100,
+        "description": "y" * 200,
+        "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"],
+        "data": {"field1": "value1", "field2": "value2", "field3": "value3"}
+    }
+    
+    for i in range(50000):  # Should create ~10-15MB file
+        record = record_template.copy()
+        record["id"] = i
+        record["name"] = f"Record_{i}_" + "x" * 100
+        data["records"].append(record)
+    
+    # Write to file
+    large_file.write_text(json.dumps(data))
+    return large_file
+
+
 class TestDeepNesting:
     """Test handling of deeply nested JSON structures."""
     
@@ -158,6 +199,7 @@ class TestDeepNesting:
 class TestLargeArrays:
     """Test handling of large arrays."""
     
+    @pytest.mark.slow
     def test_large_array_formatting(self, runner, large_array_json):
         """Test formatting of large arrays."""
         input_json = json.dumps(large_array_json)
@@ -310,112 +352,63 @@ class TestCombinedOptions:
 class TestFileOperations:
     """Test file operations with actual temp files."""
     
-    def test_temp_file_creation_and_processing(self, runner):
+    def test_temp_file_creation_and_processing(self, runner, tmp_path):
         """Test creating and processing temporary files."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tf:
-            tf.write('{"temp": true, "data": [1, 2, 3]}')
-            temp_path = tf.name
+        temp_file = tmp_path / "temp.json"
+        temp_file.write_text('{"temp": true, "data": [1, 2, 3]}')
         
-        try:
-            result = runner.invoke(main, [temp_path, "--indent", "4"])
-            assert result.exit_code == 0
-            assert '    "temp": true' in result.output
-            assert '    "data": [\n        1,' in result.output
-        finally:
-            os.unlink(temp_path)
+        result = runner.invoke(main, [str(temp_file), "--indent", "4"])
+        assert result.exit_code == 0
+        assert '    "temp": true' in result.output
+        assert '    "data": [\n        1,' in result.output
     
-    def test_multiple_temp_files(self, runner):
+    def test_multiple_temp_files(self, runner, tmp_path):
         """Test processing multiple temporary files."""
         temp_files = []
         
-        try:
-            # Create multiple temp files
-            for i in range(3):
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tf:
-                    tf.write(json.dumps({"file": i, "data": f"test{i}"}))
-                    temp_files.append(tf.name)
-            
-            # Process all files
-            result = runner.invoke(main, temp_files + ["--sort-keys"])
-            assert result.exit_code == 0
-            
-            # Check all files were processed
-            for i in range(3):
-                assert f'"file": {i}' in result.output
-                assert f'"data": "test{i}"' in result.output
-        
-        finally:
-            for tf in temp_files:
-                os.unlink(tf)
+        # Create multiple temp files
+        for i in range(3):
+            temp_file = tmp_path / f"temp{i}.json"
+            temp_file.write_text(json.dumps({"file": i, "data": f"test{i}"}))
+            temp_files.append(str(temp_file))
+        
+        # Process all files
+        result = runner.invoke(main, temp_files + ["--sort-keys"])
+        assert result.exit_code == 0
+        
+        # Check all files were processed
+        for i in range(3):
+            assert f'"file": {i}' in result.output
+            assert f'"data": "test{i}"' in result.output
     
-    def test_output_to_temp_file(self, runner):
+    def test_output_to_temp_file(self, runner, tmp_path):
         """Test writing output to temporary file."""
         input_json = '{"output": "test", "array": [1, 2, 3]}'
+        output_path = tmp_path / "output.json"
+        
+        result = runner.invoke(main, [
+            "--output", str(output_path),
+            "--indent", "4",
+            "--sort-keys"
+        ], input=input_json)
+        assert result.exit_code == 0
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tf:
-            output_path = tf.name
+        # Read and verify output
+        content = output_path.read_text()
         
-        try:
-            result = runner.invoke(main, [
-                "--output", output_path,
-                "--indent", "4",
-                "--sort-keys"
-            ], input=input_json)
-            assert result.exit_code == 0
-            
-            # Read and verify output
-            with open(output_path, 'r') as f:
-                content = f.read()
-            
-            data = json.loads(content)
-            assert data["output"] == "test"
-            assert data["array"] == [1, 2, 3]
-            
-            # Check formatting
-            assert '    "array": [' in content
-            assert content.index('"array"') < content.index('"output"')  # sorted
-        
-        finally:
-            os.unlink(output_path)
+        data = json.loads(content)
+        assert data["output"] == "test"
+        assert data["array"] == [1, 2, 3]
+        
+        # Check formatting
+        assert '    "array": [' in content
+        assert content.index('"array"') < content.index('"output"')  # sorted
 
 
+@pytest.mark.slow
 class TestLargeFileStreaming:
     """Test streaming operations with large files."""
     
-    @pytest.fixture
-    def large_file(self, tmp_path):
-        """Create a large JSON file (10MB+)."""
-        large_file = tmp_path / "large.json"
-        
-        # Create a large data structure
-        data = {
-            "metadata": {
-                "version": "1.0",
-                "created": "2024-01-01",
-                "size": "large"
-            },
-            "records": []
-        }
-        
-        # Add records until file is > 10MB
-        record_template = {
-            "id": 0,
-            "name": "x" * 100,
-            "description": "y" * 200,
-            "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"],
-            "data": {"field1": "value1", "field2": "value2", "field3": "value3"}
-        }
-        
-        for i in range(50000):  # Should create ~10-15MB file
-            record = record_template.copy()
-            record["id"] = i
-            record["name"] = f"Record_{i}_" + "x" * 100
-            data["records"].append(record)
-        
-        # Write to file
-        large_file.write_text(json.dumps(data))
-        return large_file
-    
     def test_large_file_formatting(self, runner, large_file):
         """Test formatting a large file."""
         result = runner.invoke(main, [str(large_file), "--compact"])
@@ -483,20 +476,7 @@ class TestEdgeCases:
     
     def test_special_json_values(self, runner):
         """Test handling of special JSON values."""
-        input_json = json.dumps({
-            "null_value": None,
-            "true_value": True,
-            "false_value": False,
-            "zero": 0,
-            "negative": -123,
-            "float": 3.14159,
-            "scientific": 1.23e-4,
-            "empty_string": "",
-            "escape_chars": "line1\nline2\ttab\r\nwindows",
-            "unicode_escape": "\u0048\u0065\u006c\u006c\u006f"
-        })
-        
-        result = runner.invoke(main, input=input_json)
+        result = runner.invoke(main, input=_SPECIAL_VALUES_JSON)
         assert result.exit_code == 0
         
         # Check all values are properly formatted
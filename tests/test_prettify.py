@@ -54,6 +54,14 @@ class TestPrettifyJson:
         assert "世界" in result
         assert "🌍" in result
 
+    def test_ensure_ascii(self):
+        """Test that non-ASCII characters are kept unless ensure_ascii is set."""
+        input_json = '{"message": "caf\\u00e9 世界"}'
+        assert prettify_json(input_json, compact=True) == '{"message":"café 世界"}'
+        assert prettify_json(input_json, ensure_ascii=True) == (
+            '{\n  "message": "caf\\u00e9 \\u4e16\\u754c"\n}'
+        )
+
     def test_invalid_json(self):
         """Test handling of invalid JSON."""
         with pytest.raises(json.JSONDecodeError):
@@ -94,4 +102,30 @@ class TestMinifyJson:
     def test_minify_already_minified(self):
         """Test minifying already minified JSON."""
         input_json = '{"compact":true}'
-        assert minify_json(input_json) == input_json
\ No newline at end of file
+        assert minify_json(input_json) == input_json
+
+    def test_minify_keeps_escapes_and_special_floats(self):
+        """Test that non-ASCII escaping and NaN/Infinity match the stdlib."""
+        for input_json in (
+            '["é", "\\u00e9"]', '[NaN, -Infinity, 1]', '{"a": [1, "x"]}', '["x\x7f"]'
+        ):
+            expected = json.dumps(json.loads(input_json), separators=(",", ":"))
+            assert minify_json(input_json) == expected
+            assert prettify_json(input_json, compact=True, ensure_ascii=True) == expected
+        assert prettify_json('[NaN]', indent=2) == '[\n  NaN\n]'
+
+    def test_text_after_nul_is_rejected(self):
+        """Test that nothing after a NUL character is ignored."""
+        for func in (minify_json, prettify_json):
+            with pytest.raises(json.JSONDecodeError):
+                func('{"a": 1}\x00{"b": 2}')
+        assert validate_json('[1]\x00garbage') is not True
+
+    def test_overflowing_numbers_stay_infinite(self):
+        """Test that numbers beyond the float range are written as Infinity, not null."""
+        for input_json in ('[1e400]', '{"a":-1e999}', '[18e307, null]'):
+            expected = json.dumps(json.loads(input_json), separators=(",", ":"))
+            assert minify_json(input_json) == expected
+            assert prettify_json(input_json, compact=True) == expected
+            assert prettify_json(input_json) == json.dumps(json.loads(input_json), indent=2)
+        assert minify_json('[NaN, null]') == '[NaN,null]'
@@ -0,0 +1,129 @@
+"""Tests for JSON Schema validation functionality."""
+
+import json
+import os
+
+import pytest
+
+from json_prettify.schema_validator import (
+    SchemaValidator,
+    clear_schema_cache,
+    validate_against_schema,
+)
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"name": {"type": "string"}},
+    "required": ["name"],
+}
+
+
+class TestSchemaValidator:
+    """Test cases for schema loading and validation."""
+
+    def test_validate_against_schema(self, tmp_path):
+        """Test valid and invalid documents against a schema file."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(SCHEMA))
+
+        assert validate_against_schema('{"name": "John"}', schema_file) == []
+        errors = validate_against_schema('{"age": 30}', schema_file)
+        assert errors == ["Missing required property 'name' at root"]
+
+    def test_from_file_reuses_schema(self, tmp_path):
+        """Test that loading the same schema twice reuses the parsed and compiled schema."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(SCHEMA))
+
+        first = SchemaValidator.from_file(schema_file)
+        second = SchemaValidator.from_file(str(schema_file))
+        assert second is not first
+        assert second.schema is first.schema
+        assert second._fast is first._fast
+
+    def test_from_file_builds_subclass(self, tmp_path):
+        """Test that from_file returns an instance of the class it is called on."""
+        class CustomValidator(SchemaValidator):
+            pass
+
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(SCHEMA))
+
+        assert type(SchemaValidator.from_file(schema_file)) is SchemaValidator
+        assert type(CustomValidator.from_file(schema_file)) is CustomValidator
+
+    def test_clear_schema_cache(self, tmp_path):
+        """Test that clearing the cache forces the schema to be reloaded."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(SCHEMA))
+        first = SchemaValidator.from_file(schema_file)
+
+        clear_schema_cache()
+        assert SchemaValidator.from_file(schema_file).schema is not first.schema
+
+    def test_from_file_reloads_modified_schema(self, tmp_path):
+        """Test that editing the schema file invalidates the cached validator."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(SCHEMA))
+        first = SchemaValidator.from_file(schema_file)
+
+        schema_file.write_text(json.dumps({"type": "array"}))
+        stat = schema_file.stat()
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = SchemaValidator.from_file(schema_file)
+        assert second.schema == {"type": "array"}
+        assert second.is_valid([])
+
+    def test_from_file_errors(self, tmp_path):
+        """Test that missing or malformed schema files raise ValueError."""
+        with pytest.raises(ValueError, match="Error loading schema file"):
+            SchemaValidator.from_file(tmp_path / "missing.json")
+
+        bad_schema = tmp_path / "bad.json"
+        bad_schema.write_text("{not json")
+        with pytest.raises(ValueError, match="Invalid JSON in schema file"):
+            SchemaValidator.from_file(bad_schema)
+
+    def test_validate_reports_all_errors(self):
+        """Test that every violation is reported, not just the first."""
+        validator = SchemaValidator({
+            "type": "object",
+            "properties": {"age": {"type": "integer", "minimum": 0}},
+            "required": ["name", "age"],
+        })
+
+        errors = validator.validate({"age": -1, "extra": True})
+        assert len(errors) == 2
+        assert "Number at root.age is below minimum (0)" in errors
+        assert not validator.is_valid({"age": -1})
+        assert validator.is_valid({"name": "John", "age": 1})
+
+    def test_validate_matches_draft7_semantics(self):
+        """Test that formats are not asserted and defaults are not applied."""
+        validator = SchemaValidator({
+            "type": "object",
+            "properties": {
+                "email": {"type": "string", "format": "email"},
+                "role": {"type": "string", "default": "user"},
+            },
+        })
+
+        data = {"email": "not-an-email"}
+        assert validator.validate(data) == []
+        assert validator.is_valid(data)
+        assert data == {"email": "not-an-email"}
+
+    def test_validate_multiple_of_matches_draft7(self):
+        """Test that multipleOf is decided by Draft7 semantics, not float division."""
+        validator = SchemaValidator({"type": "object", "properties": {
+            "step": {"multipleOf": 0.1},
+            "count": {"multipleOf": 3},
+        }})
+
+        assert validator.validate({"step": 0.3, "count": 6}) == [
+            "Schema validation error at root.step: 0.3 is not a multiple of 0.1"
+        ]
+        assert not validator.is_valid({"count": 10**20 + 1})
+        assert validator.is_valid({"step": 0.5, "count": 9})
@@ -0,0 +1,168 @@
+"""Tests for JSON statistics functionality."""
+
+import json
+import sys
+
+import pytest
+
+from json_prettify.stats import calculate_json_stats, format_stats_output
+
+
+class TestCalculateJsonStats:
+    """Test cases for calculate_json_stats function."""
+
+    def test_counts_and_depth(self):
+        """Test type counts, key counts and nesting depth."""
+        stats = calculate_json_stats(
+            '{"name": "John", "tags": ["a", "bc"], "address": {"city": null, "zip": 12345}}'
+        )
+
+        assert stats.total_objects == 2
+        assert stats.total_arrays == 1
+        assert stats.total_strings == 3
+        assert stats.total_numbers == 1
+        assert stats.total_nulls == 1
+        assert stats.total_keys == 5
+        assert stats.unique_keys == 5
+        assert stats.max_depth == 2
+
+    def test_length_aggregates(self):
+        """Test array and string length aggregates."""
+        stats = calculate_json_stats('{"a": [[], [1, 2, 3]], "b": ["", "abcd"]}')
+        summary = stats.get_summary()
+
+        assert summary["arrays_info"] == {
+            "count": 4, "avg_length": 1.75, "max_length": 3, "min_length": 0
+        }
+        assert summary["strings_info"] == {
+            "count": 2, "avg_length": 2.0, "max_length": 4, "min_length": 0
+        }
+        assert "arrays_info" not in calculate_json_stats('{"a": 1}').get_summary()
+
+    def test_top_keys(self):
+        """Test that the ten most frequent keys match a full descending sort."""
+        data = [{f"k{i}": 0 for i in range(12)}, {"k11": 0, "k5": 0}]
+        stats = calculate_json_stats(data)
+        expected = sorted(stats.key_frequencies.items(), key=lambda x: x[1], reverse=True)
+
+        top_keys = stats.get_summary()["top_keys"]
+        assert list(top_keys.items()) == expected[:10]
+        assert list(top_keys.values())[:3] == [2, 2, 1]
+
+    def test_top_keys_ties_in_document_order(self):
+        """Test that tied keys are ranked in the order the document first has them."""
+        stats = calculate_json_stats('[{"z": {"y": [{"m": 0}]}, "a": 0}, {"b": {"y": 1}}]')
+        assert list(stats.get_summary()["top_keys"]) == ["y", "z", "m", "a", "b"]
+
+    def test_booleans_are_not_numbers(self):
+        """Test that true/false are counted as booleans only."""
+        stats = calculate_json_stats('[true, false, 1, 2.5, null]')
+
+        assert stats.total_booleans == 2
+        assert stats.total_numbers == 2
+        assert stats.total_nulls == 1
+
+    def test_parsed_input(self):
+        """Test that parsed data gives the same counts as JSON text."""
+        data = {"items": [{"id": i, "name": f"Item {i}"} for i in range(10)]}
+        from_text = calculate_json_stats(json.dumps(data))
+        from_data = calculate_json_stats(data)
+
+        assert from_data.total_keys == from_text.total_keys == 21
+        assert from_data.key_frequencies == from_text.key_frequencies
+        assert from_data.max_depth == from_text.max_depth == 3
+
+    def test_parsed_input_size(self):
+        """Test that parsed data is sized as compact UTF-8 JSON."""
+        data = {"text": "café", "items": [1, 2.5, None]}
+        compact = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        assert calculate_json_stats(data).total_size == len(compact.encode("utf-8"))
+
+        # Integer keys and big integers are sized like the stdlib writes them
+        data = {1: 123456789012345678901234567890}
+        assert calculate_json_stats(data).total_size == len('{"1":123456789012345678901234567890}')
+
+    def test_deeply_nested_document(self, monkeypatch):
+        """Test that nesting beyond rapidjson's depth limit falls back to the stdlib."""
+        from json_prettify import formatter
+
+        pytest.importorskip("rapidjson")
+        monkeypatch.setattr(formatter, "orjson", None)
+        # The stdlib parser recurses too, so its own RecursionError surfaces
+        # rather than rapidjson's
+        with pytest.raises(RecursionError, match="while decoding a JSON array"):
+            calculate_json_stats("[" * 100000 + "0" + "]" * 100000)
+
+    def test_nesting_beyond_recursion_limit(self):
+        """Test that the walk does not recurse once the document is parsed."""
+        depth = sys.getrecursionlimit() + 500
+        stats = calculate_json_stats("[" * depth + "0" + "]" * depth)
+        assert stats.max_depth == depth
+        assert stats.total_arrays == depth
+        assert stats.total_numbers == 1
+
+    def test_stats_are_slotted_and_picklable(self):
+        """Test that stats carry no instance dict and survive pickling."""
+        import pickle
+
+        stats = calculate_json_stats('{"a": [1, "x"]}')
+        assert not hasattr(stats, "__dict__")
+        assert pickle.loads(pickle.dumps(stats)) == stats
+
+    def test_streamed_counts_match_parsed(self, monkeypatch):
+        """Test that counting ijson events gives the same stats as the tree walk."""
+        from json_prettify import stats as stats_module
+
+        pytest.importorskip("ijson")
+        documents = [
+            '{"a": [[], [1, 2.5, "x"]], "b": {"c": null, "d": [true, {"a": ""}]}}',
+            '[{"id": 1, "tags": ["é", "abc"]}, {"id": 2, "tags": []}]',
+            '"text"',
+            '[NaN, 1]',
+            # Parsing keeps only the last value of a repeated key
+            '{"a": [1, "x", {"b": 2}], "c": {"d": 1, "d": {"e": true}}, "a": null}',
+        ]
+        expected = [calculate_json_stats(document) for document in documents]
+
+        monkeypatch.setattr(stats_module, "STREAM_MIN_SIZE", 0)
+        assert [calculate_json_stats(document) for document in documents] == expected
+        for invalid in ['{"invalid": json}', '{"a":\x0c1}', '[1,\x0b2]']:
+            with pytest.raises(ValueError, match="Invalid JSON"):
+                calculate_json_stats(invalid)
+
+    def test_streamed_top_keys_match_parsed(self, monkeypatch):
+        """Test that both paths rank tied keys the same way."""
+        from json_prettify import stats as stats_module
+
+        pytest.importorskip("ijson")
+        document = json.dumps([
+            {f"k{i}": {f"n{i}": [{"deep": i}]} for i in range(8)},
+            {"late": 0, "k3": 0, "n5": 0},
+        ])
+        expected = calculate_json_stats(document).get_summary()["top_keys"]
+
+        monkeypatch.setattr(stats_module, "STREAM_MIN_SIZE", 0)
+        streamed = calculate_json_stats(document).get_summary()["top_keys"]
+        assert list(streamed.items()) == list(expected.items())
+        assert list(expected)[:4] == ["deep", "k3", "n5", "k0"]
+
+    def test_invalid_json(self):
+        """Test that invalid JSON raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            calculate_json_stats('{"invalid": json}')
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            calculate_json_stats('{"a": 1}\x00{"b": 2}')
+
+
+class TestFormatStatsOutput:
+    """Test cases for format_stats_output function."""
+
+    def test_format_stats_output(self):
+        """Test the rendered statistics summary."""
+        stats = calculate_json_stats('{"a": [1, 2, 3], "b": "text"}')
+        output = format_stats_output(stats, no_color=True)
+
+        assert "=== JSON Statistics ===" in output
+        assert "Maximum depth: 2" in output
+        assert "Average length: 3.0" in output
+        assert "'a': 1 occurrences" in output
@@ -10,7 +10,10 @@ from pathlib import Path
 # These imports will fail initially - that's expected in TDD
 from json_prettify.validator import (
     validate_json,
+    validate_json_bytes,
     validate_json_file,
+    validate_json_files,
+    validate_json_stream,
     get_validation_errors,
     JSONValidationError
 )
@@ -19,28 +22,30 @@ from json_prettify.validator import (
 class TestValidateJson:
     """Test cases for validate_json function."""
     
-    def test_validate_valid_json_objects(self):
+    @pytest.mark.parametrize("doc", [
+        '{}',
+        '{"key": "value"}',
+        '{"name": "John", "age": 30}',
+        '{"nested": {"key": "value"}}',
+    ])
+    def test_validate_valid_json_objects(self, doc):
         """Test validation of valid JSON objects."""
-        assert validate_json('{}') is True
-        assert validate_json('{"key": "value"}') is True
-        assert validate_json('{"name": "John", "age": 30}') is True
-        assert validate_json('{"nested": {"key": "value"}}') is True
-        
-    def test_validate_valid_json_arrays(self):
+        assert validate_json(doc) is True
+        
+    @pytest.mark.parametrize("doc", [
+        '[]',
+        '[1, 2, 3]',
+        '["a", "b", "c"]',
+        '[{"id": 1}, {"id": 2}]',
+    ])
+    def test_validate_valid_json_arrays(self, doc):
         """Test validation of valid JSON arrays."""
-        assert validate_json('[]') is True
-        assert validate_json('[1, 2, 3]') is True
-        assert validate_json('["a", "b", "c"]') is True
-        assert validate_json('[{"id": 1}, {"id": 2}]') is True
+        assert validate_json(doc) is True
         
-    def test_validate_valid_json_primitives(self):
+    @pytest.mark.parametrize("doc", ['null', 'true', 'false', '42', '-3.14', '"hello"'])
+    def test_validate_valid_json_primitives(self, doc):
         """Test validation of valid JSON primitive values."""
-        assert validate_json('null') is True
-        assert validate_json('true') is True
-        assert validate_json('false') is True
-        assert validate_json('42') is True
-        assert validate_json('-3.14') is True
-        assert validate_json('"hello"') is True
+        assert validate_json(doc) is True
         
     def test_validate_invalid_json_syntax(self):
         """Test validation detects syntax errors."""
@@ -82,11 +87,14 @@ class TestValidateJson:
         # Should mention at least one error
         assert "error" in result.lower()
         
-    def test_validate_unicode_handling(self):
+    @pytest.mark.parametrize("doc", [
+        '{"text": "Hello 世界"}',
+        '{"emoji": "👋🌍"}',
+        '{"escaped": "\\u4e16\\u754c"}',
+    ])
+    def test_validate_unicode_handling(self, doc):
         """Test validation handles Unicode correctly."""
-        assert validate_json('{"text": "Hello 世界"}') is True
-        assert validate_json('{"emoji": "👋🌍"}') is True
-        assert validate_json('{"escaped": "\\u4e16\\u754c"}') is True
+        assert validate_json(doc) is True
         
     def test_validate_edge_cases(self):
         """Test validation of edge cases."""
@@ -107,6 +115,35 @@ class TestValidateJson:
         result = validate_json('{"bad": "\\x"}')
         assert result is not True
 
+    def test_validate_results_are_memoized(self):
+        """Test that short strings are validated once and long ones every time."""
+        from json_prettify import validator
+
+        validator._validate_json_cached.cache_clear()
+        for _ in range(3):
+            assert validate_json('{"memo": 1}') is True
+            assert validate_json('{"memo": 1}', strict=True) is True
+        info = validator._validate_json_cached.cache_info()
+        assert (info.hits, info.misses) == (4, 2)
+
+        long_json = '[' + '1, ' * validator._MEMO_MAX_LENGTH + '1]'
+        assert validate_json(long_json) is True
+        assert validator._validate_json_cached.cache_info().currsize == 2
+
+    def test_validate_common_error_line_numbers(self):
+        """Test that heuristic errors report the offending line."""
+        result = validate_json('{"a": [1, 2,]\n,\n"b": 1,}\n')
+        assert result == "Trailing comma detected at line 1"
+        result = validate_json("\n\n{'key': 1}")
+        assert result == "Single quotes are not valid in JSON at line 3"
+
+
+    def test_validate_rejects_text_after_nul(self):
+        """Test that nothing after a NUL character is ignored."""
+        assert validate_json('[1]\x00garbage') == "Extra data after JSON at line 1, column 4"
+        assert validate_json(b'[1]\x00garbage') is not True
+        assert get_validation_errors('[1]\x00garbage') != []
+
 
 class TestValidateJsonFile:
     """Test cases for validate_json_file function."""
@@ -134,6 +171,52 @@ class TestValidateJsonFile:
         assert result is not True
         assert "not found" in result.lower() or "does not exist" in result.lower()
         
+    def test_validate_file_without_size(self, tmp_path, monkeypatch):
+        """Test files that report no size and reads that return less than asked."""
+        import os
+        import threading
+
+        if not hasattr(os, "mkfifo"):
+            pytest.skip("named pipes need POSIX")
+        fifo = tmp_path / "pipe.json"
+        os.mkfifo(fifo)
+        writer = threading.Thread(target=fifo.write_text, args=('{"piped": [1, 2, 3]}',))
+        writer.start()
+        assert validate_json_file(str(fifo)) is True
+        writer.join()
+
+        json_file = tmp_path / "short.json"
+        json_file.write_text('{"items": [1, 2, 3], "name": "short reads"}')
+        read = os.read
+        monkeypatch.setattr(os, "read", lambda fd, n: read(fd, min(n, 7)))
+        assert validate_json_file(str(json_file)) is True
+        json_file.write_text('{"items": [1, 2, 3], "name": "short reads",}')
+        assert "Trailing comma" in validate_json_file(str(json_file))
+
+    def test_validate_file_encoding_error_names_path(self, tmp_path):
+        """Test that encoding errors give the full path, telling same-named files apart."""
+        results = []
+        for directory in ("first", "second"):
+            json_file = tmp_path / directory / "data.json"
+            json_file.parent.mkdir()
+            json_file.write_bytes(b'{"name": "\xff"}')
+            results.append(validate_json_file(str(json_file)))
+            assert results[-1].startswith(f"Encoding error in {json_file}: ")
+        assert results[0] != results[1]
+
+    def test_validate_file_with_nul(self, tmp_path):
+        """Test that a document after a NUL byte is not ignored."""
+        json_file = tmp_path / "nul.json"
+        json_file.write_bytes(b'{"a": 1}\x00{"b": 2}')
+        assert validate_json_file(str(json_file)) == (
+            "nul.json: Extra data after JSON at line 1, column 9"
+        )
+
+    def test_validate_unreadable_path(self, tmp_path):
+        """Test that a path that cannot be read reports a read error."""
+        result = validate_json_file(str(tmp_path))
+        assert result.startswith(f"Error reading {tmp_path}")
+        
     def test_validate_file_with_bom(self, tmp_path):
         """Test validation handles files with BOM (Byte Order Mark)."""
         json_file = tmp_path / "bom.json"
@@ -142,17 +225,84 @@ class TestValidateJsonFile:
         
         assert validate_json_file(str(json_file)) is True
         
-    def test_validate_large_file(self, tmp_path):
-        """Test validation of large JSON files."""
+    def test_validate_large_file(self, tmp_path, large_json_bytes):
+        """Test validation of large JSON documents, in memory and on disk."""
+        assert validate_json_bytes(large_json_bytes) is True
+
         json_file = tmp_path / "large.json"
-        
-        # Create a large but valid JSON file
-        large_data = {"items": [{"id": i} for i in range(10000)]}
-        import json
-        json_file.write_text(json.dumps(large_data))
-        
+        json_file.write_bytes(large_json_bytes)
         assert validate_json_file(str(json_file)) is True
 
+    def test_validate_json_bytes(self):
+        """Test validation of raw bytes with a BOM, errors and other encodings."""
+        assert validate_json_bytes(b'\xef\xbb\xbf{"valid": true}') is True
+        assert validate_json_bytes('{"café": 1}'.encode("latin-1"), encoding="latin-1") is True
+
+        result = validate_json_bytes(b'{"invalid": json}', name="doc.json")
+        assert result.startswith("doc.json: ")
+        assert validate_json_bytes(b'"\xff"').startswith("Encoding error in <memory>")
+
+    def test_validate_json_stream(self, tmp_path, large_json_bytes, monkeypatch):
+        """Test streamed validation of file objects and of large files."""
+        import io
+        from json_prettify import validator
+
+        pytest.importorskip("ijson")
+        assert validate_json_stream(io.BytesIO(large_json_bytes)) is True
+        result = validate_json_stream(io.BytesIO(b'{"items": [1,]}'))
+        assert result.startswith("Invalid JSON: ")
+        assert "\n" not in result
+
+        # Files simdjson cannot take are streamed, falling back for errors
+        monkeypatch.setattr(validator, "simdjson", None)
+        monkeypatch.setattr(validator, "STREAM_MIN_SIZE", 0)
+        json_file = tmp_path / "large.json"
+        json_file.write_bytes(large_json_bytes)
+        assert validate_json_file(str(json_file)) is True
+        json_file.write_bytes(b'\xef\xbb\xbf[NaN]')
+        assert validate_json_file(str(json_file)) is True
+        json_file.write_bytes(b'{"items": }')
+        assert validate_json_file(str(json_file)).startswith("large.json: ")
+
+    def test_validate_json_stream_is_strict(self, tmp_path, monkeypatch):
+        """Test that yajl's extra whitespace and encoded surrogates are errors."""
+        import io
+        from json_prettify import validator
+
+        pytest.importorskip("ijson")
+        for document in (b'[1,\x0b2]', b'\x0c{"a": 1}', b'[1]\x0b'):
+            result = validate_json_stream(io.BytesIO(document), chunk_size=2)
+            assert result.startswith("Invalid JSON: invalid whitespace character at byte ")
+        assert validate_json_stream(io.BytesIO(b'[1,\x0b2]')).endswith(" byte 3")
+        assert validate_json_stream(io.BytesIO(b'["\xed\xa0\x80"]')).startswith(
+            "Encoding error: "
+        )
+
+        monkeypatch.setattr(validator, "simdjson", None)
+        monkeypatch.setattr(validator, "STREAM_MIN_SIZE", 0)
+        json_file = tmp_path / "large.json"
+        json_file.write_bytes(b'{"items": [1,\x0c2]}')
+        assert validate_json_file(str(json_file)).startswith("large.json: ")
+        json_file.write_bytes(b'["\xed\xa0\x80"]')
+        assert validate_json_file(str(json_file)).startswith(f"Encoding error in {json_file}: ")
+
+    def test_validate_json_files(self, tmp_path):
+        """Test batch validation, serially and with a process pool."""
+        paths = []
+        for i in range(12):
+            json_file = tmp_path / f"file{i}.json"
+            json_file.write_text('{"id": %d}' % i if i != 5 else '{"id": }')
+            paths.append(str(json_file))
+
+        for batch in (paths[:3], paths):
+            results = validate_json_files(batch, workers=2)
+            assert list(results) == batch
+            for path, result in results.items():
+                if path.endswith("file5.json"):
+                    assert "file5.json" in result
+                else:
+                    assert result is True
+
 
 class TestGetValidationErrors:
     """Test cases for get_validation_errors function."""
@@ -253,6 +403,23 @@ class TestValidatorEdgeCases:
         # Should validate successfully (within nesting limits)
         assert validate_json(deep_json) is True
         
+    def test_errors_come_from_a_single_parse(self, monkeypatch):
+        """Test that invalid input is parsed once for its detailed errors."""
+        from json_prettify import validator
+
+        calls = []
+
+        def counting_loads(data, exact=True):
+            calls.append(data)
+            return _fast_loads(data, exact)
+
+        _fast_loads = validator._fast_loads
+        monkeypatch.setattr(validator, "_fast_loads", counting_loads)
+        errors = get_validation_errors('{"a": 1 "b": 2}')
+        assert len(errors) == 1
+        assert errors[0].message == "Missing comma between elements"
+        assert len(calls) == 1
+        
     def test_validate_json_with_duplicated_keys(self):
         """Test validation detects duplicate keys."""
         # Standard JSON allows duplicate keys, but it's often an error
@@ -262,6 +429,11 @@ class TestValidatorEdgeCases:
         result = validate_json(json_with_dupes, strict=True)
         if result is not True:
             assert "duplicate" in result.lower()
+
+        # Nested objects are checked and quotes inside strings are ignored
+        assert validate_json('{"a": {"b": 1, "b": 2}}', strict=True) == "Duplicate key 'b' detected"
+        assert validate_json('{"a": "x\\":", "b": {"a": 1}}', strict=True) is True
+        assert validate_json('[{"a": 1}, {"a": 2}]', strict=True) is True
             
     def test_validate_json_size_limits(self):
         """Test validation handles size limits gracefully."""
@@ -272,6 +444,14 @@ class TestValidatorEdgeCases:
         result = validate_json(large_json)
         assert result is True or "size" in str(result).lower()
         
+    def test_validate_bytes_input(self):
+        """Test that UTF-8 bytes validate like the text they encode."""
+        assert validate_json(b'{"data": "' + b'x' * 1024 * 1024 + b'"}') is True
+        assert validate_json('\ufeff{"név": [NaN]}'.encode("utf-8")) is True
+        assert validate_json(b'{"a": 1, "a": 2}', strict=True) == "Duplicate key 'a' detected"
+        assert validate_json(b'{"a": 1,}') == validate_json('{"a": 1,}')
+        assert validate_json(b'["\xff"]').startswith("Encoding error: ")
+        
     def test_validate_special_number_formats(self):
         """Test validation of special number formats."""
         # Scientific notation
@@ -282,7 +462,47 @@ class TestValidatorEdgeCases:
         
         # Negative zero
         assert validate_json('{"negzero": -0}') is True
-        
+
+    def test_validate_matches_stdlib_leniency(self):
+        """Test that values only the stdlib parser accepts are still valid."""
+        for text in ('[NaN, -Infinity]', '{"huge": 1e999}', '["\\ud800"]'):
+            assert validate_json(text) is True
+            assert get_validation_errors(text) == []
+        
+    def test_validate_same_with_or_without_simdjson(self, monkeypatch):
+        """Test that the simdjson shortcut never changes a result."""
+        from json_prettify import validator
+
+        pytest.importorskip("simdjson")
+        texts = ['{"a": [1, 2.5, "x"]}', '\ufeff{}', '[NaN]', '[123456789012345678901234567890]', '[1, }']
+        expected = [validate_json(text) for text in texts]
+        monkeypatch.setattr(validator, "simdjson", None)
+        validator._validate_json_cached.cache_clear()
+        assert [validate_json(text) for text in texts] == expected
+        assert expected[0] is True and "BOM" in expected[1]
+
+    def test_validate_from_many_threads(self):
+        """Test that concurrent validation in threads gives consistent results."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Longer than the memo limit, so every call reaches the parser
+        valid = '[' + ', '.join(['{"id": 1}'] * 500) + ']'
+        texts = [valid, valid[:-1]] * 200
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(validate_json, texts))
+        assert results[0::2] == [True] * 200
+        assert all(isinstance(result, str) for result in results[1::2])
+
+    def test_validate_does_not_grow_non_ascii_input(self):
+        """Test that validating a non-ASCII str leaves no UTF-8 copy attached to it."""
+        import sys
+
+        pytest.importorskip("simdjson")
+        text = '["' + "é" * 10000 + '"]'
+        size = sys.getsizeof(text)
+        assert validate_json(text) is True
+        assert sys.getsizeof(text) == size
+
     def test_validate_control_characters(self):
         """Test validation of control characters in strings."""
         # Unescaped control characters are invalid